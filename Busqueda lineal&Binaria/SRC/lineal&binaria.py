@@ -2,6 +2,18 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import numpy as np
 import time
+import gc
+import math
+import struct
+import sys
+import json
+import csv
+import argparse
+import platform
+import os
+import threading
+import multiprocessing as mp
+from multiprocessing import shared_memory
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
@@ -14,8 +26,9 @@ def busqueda_lineal(lista, valor):
             return i
     return -1
 
-def busqueda_binaria(lista, valor):
-    izquierda, derecha = 0, len(lista) - 1
+def busqueda_binaria(lista, valor, izquierda=0, derecha=None):
+    if derecha is None:
+        derecha = len(lista) - 1
     while izquierda <= derecha:
         medio = (izquierda + derecha) // 2
         if lista[medio] == valor:
@@ -26,6 +39,1195 @@ def busqueda_binaria(lista, valor):
             derecha = medio - 1
     return -1
 
+def busqueda_binaria_lote(arreglo, valores):
+    """Busca todos los valores de una vez sobre un arreglo NumPy ordenado.
+
+    Devuelve un arreglo de índices (int64) con -1 donde el valor no está.
+    """
+    arreglo = np.asarray(arreglo)
+    valores = np.asarray(valores)
+    posiciones = np.searchsorted(arreglo, valores, side="left")
+    dentro = posiciones < len(arreglo)
+    encontrados = np.zeros(len(valores), dtype=bool)
+    encontrados[dentro] = arreglo[posiciones[dentro]] == valores[dentro]
+    return np.where(encontrados, posiciones, -1).astype(np.int64)
+
+def limite_inferior(lista, valor, izquierda=0, derecha=None):
+    """Primer índice i con lista[i] >= valor (len(lista) si no hay ninguno)."""
+    if derecha is None:
+        derecha = len(lista)
+    while izquierda < derecha:
+        medio = (izquierda + derecha) // 2
+        if lista[medio] < valor:
+            izquierda = medio + 1
+        else:
+            derecha = medio
+    return izquierda
+
+def limite_superior(lista, valor, izquierda=0, derecha=None):
+    """Primer índice i con lista[i] > valor (len(lista) si no hay ninguno)."""
+    if derecha is None:
+        derecha = len(lista)
+    while izquierda < derecha:
+        medio = (izquierda + derecha) // 2
+        if lista[medio] <= valor:
+            izquierda = medio + 1
+        else:
+            derecha = medio
+    return izquierda
+
+def contar_ocurrencias_lote(arreglo, valores):
+    """Cuántas veces aparece cada valor en el arreglo ordenado (vectorizado)."""
+    arreglo = np.asarray(arreglo)
+    valores = np.asarray(valores)
+    return (np.searchsorted(arreglo, valores, side="right")
+            - np.searchsorted(arreglo, valores, side="left")).astype(np.int64)
+
+def rango_entre(arreglo, a, b):
+    """Índices [inicio, fin) de los elementos con a <= x <= b; arreglo[inicio:fin] es el rango."""
+    arreglo = np.asarray(arreglo)
+    inicio = int(np.searchsorted(arreglo, a, side="left"))
+    fin = int(np.searchsorted(arreglo, b, side="right"))
+    return inicio, max(inicio, fin)
+
+def contar_rango_lote(arreglo, a, b):
+    """Cuántos elementos caen en cada intervalo [a[i], b[i]] (vectorizado)."""
+    arreglo = np.asarray(arreglo)
+    conteo = (np.searchsorted(arreglo, np.asarray(b), side="right")
+              - np.searchsorted(arreglo, np.asarray(a), side="left"))
+    return np.maximum(conteo, 0).astype(np.int64)
+
+def busqueda_interpolacion(lista, valor):
+    """Estima la posición por interpolación lineal entre los extremos.
+
+    Sobre claves casi uniformes necesita O(log log n) sondeos; en el peor
+    caso (distribución muy sesgada) degrada a O(n).
+    """
+    izquierda, derecha = 0, len(lista) - 1
+    while izquierda <= derecha:
+        bajo, alto = lista[izquierda], lista[derecha]
+        if valor < bajo or valor > alto:
+            return -1
+        if alto == bajo:
+            return izquierda if bajo == valor else -1
+        # int() evita desbordes con escalares de NumPy
+        medio = izquierda + (int(valor) - int(bajo)) * (derecha - izquierda) // (int(alto) - int(bajo))
+        if lista[medio] == valor:
+            return medio
+        elif lista[medio] < valor:
+            izquierda = medio + 1
+        else:
+            derecha = medio - 1
+    return -1
+
+def busqueda_exponencial(lista, valor):
+    """Duplica el límite desde el inicio hasta rebasar el valor y luego hace binaria."""
+    n = len(lista)
+    if n == 0:
+        return -1
+    if lista[0] == valor:
+        return 0
+    limite = 1
+    while limite < n and lista[limite] < valor:
+        limite *= 2
+    return busqueda_binaria(lista, valor, limite // 2, min(limite, n - 1))
+
+def busqueda_galope(lista, valor, inicio=None):
+    """Galopa (pasos 1, 2, 4, ...) desde una posición inicial en ambas direcciones.
+
+    Si no se da `inicio`, se estima por interpolación entre los extremos, así
+    que combina la buena conjetura de interpolación con el peor caso
+    O(log n) de la búsqueda exponencial.
+    """
+    n = len(lista)
+    if n == 0:
+        return -1
+    if inicio is None:
+        bajo, alto = int(lista[0]), int(lista[n - 1])
+        if alto == bajo:
+            inicio = 0
+        else:
+            inicio = (int(valor) - bajo) * (n - 1) // (alto - bajo)
+    inicio = min(max(inicio, 0), n - 1)
+
+    if lista[inicio] == valor:
+        return inicio
+    paso = 1
+    if lista[inicio] < valor:
+        izquierda = inicio
+        while inicio + paso < n and lista[inicio + paso] < valor:
+            izquierda = inicio + paso
+            paso *= 2
+        return busqueda_binaria(lista, valor, izquierda + 1, min(inicio + paso, n - 1))
+    else:
+        derecha = inicio
+        while inicio - paso >= 0 and lista[inicio - paso] > valor:
+            derecha = inicio - paso
+            paso *= 2
+        return busqueda_binaria(lista, valor, max(inicio - paso, 0), derecha - 1)
+
+# Algoritmos que requieren la lista ordenada (candidatos del selector)
+BUSQUEDAS_ORDENADAS = {
+    "Binaria": busqueda_binaria,
+    "Interpolación": busqueda_interpolacion,
+    "Exponencial": busqueda_exponencial,
+    "Galope": busqueda_galope,
+}
+
+class _ListaContadora:
+    """Envuelve una secuencia y cuenta los accesos por índice (sondeos)."""
+    def __init__(self, lista):
+        self.lista = lista
+        self.sondeos = 0
+
+    def __len__(self):
+        return len(self.lista)
+
+    def __getitem__(self, i):
+        self.sondeos += 1
+        return self.lista[i]
+
+def contar_sondeos(algoritmo, lista, valor):
+    """Ejecuta el algoritmo y devuelve (indice, número de sondeos a la lista)."""
+    envoltura = _ListaContadora(lista)
+    indice = algoritmo(envoltura, valor)
+    return indice, envoltura.sondeos
+
+def seleccionar_busqueda(lista, muestras=64, semilla=None):
+    """Elige el algoritmo ordenado con menos sondeos esperados para esta lista.
+
+    Toma claves al azar de la propia lista (así la muestra sigue su
+    distribución) y promedia los sondeos de cada candidato.
+    Devuelve (nombre, {nombre: sondeos_promedio}).
+    """
+    if len(lista) == 0:
+        return "Binaria", {}
+    rng = np.random.default_rng(semilla)
+    consultas = [lista[p] for p in rng.integers(0, len(lista), muestras)]
+    promedios = {}
+    for nombre, algoritmo in BUSQUEDAS_ORDENADAS.items():
+        total = sum(contar_sondeos(algoritmo, lista, v)[1] for v in consultas)
+        promedios[nombre] = total / len(consultas)
+    mejor = min(promedios, key=promedios.get)
+    return mejor, promedios
+
+# ---------------------------
+# Backends de datos (listas vs arreglos tipados)
+# ---------------------------
+# "lista numpy" reproduce el comportamiento original: una lista de Python
+# con escalares np.int64 en caja, cada comparación pasa por NumPy. Los
+# backends tipados guardan los valores contiguos en un arreglo y las
+# búsquedas escalares los leen a través de un memoryview, que devuelve
+# int/float de Python directamente sin crear escalares de NumPy.
+BACKENDS_DATOS = {
+    "lista numpy": None,
+    "lista int": None,
+    "int32": np.int32,
+    "int64": np.int64,
+    "float32": np.float32,
+}
+
+def construir_backend(arreglo, backend):
+    """Devuelve (secuencia para búsquedas escalares, arreglo tipado para las vectorizadas)."""
+    arreglo = np.asarray(arreglo)
+    if backend == "lista numpy":
+        return list(arreglo), arreglo
+    if backend == "lista int":
+        return arreglo.tolist(), arreglo
+    if backend not in BACKENDS_DATOS:
+        raise ValueError(f"Backend no soportado: {backend}")
+    tipado = np.ascontiguousarray(arreglo, dtype=BACKENDS_DATOS[backend])
+    return memoryview(tipado), tipado
+
+def memoria_backend(secuencia):
+    """Bytes que ocupa la secuencia, incluidos los objetos en caja de una lista.
+
+    Los objetos compartidos (p. ej. enteros pequeños cacheados) se cuentan una vez.
+    """
+    if isinstance(secuencia, memoryview):
+        return sys.getsizeof(secuencia) + secuencia.nbytes
+    if isinstance(secuencia, np.ndarray):
+        return secuencia.nbytes
+    unicos = {id(x): x for x in secuencia}
+    return sys.getsizeof(secuencia) + sum(sys.getsizeof(x) for x in unicos.values())
+
+def comparar_backends(arreglo, valores, duracion_objetivo=0.1):
+    """Memoria y tiempo de búsqueda binaria escalar por backend.
+
+    Devuelve {backend: {"memoria_bytes", "binaria_s"}} con el tiempo medio
+    por consulta sobre `valores`.
+    """
+    resultados = {}
+    for backend in BACKENDS_DATOS:
+        secuencia, _ = construir_backend(arreglo, backend)
+        stats = medir_tiempo(lambda: [busqueda_binaria(secuencia, v) for v in valores],
+                             duracion_objetivo=duracion_objetivo, min_muestras=3)
+        resultados[backend] = {
+            "memoria_bytes": memoria_backend(secuencia),
+            "binaria_s": stats["mediana"] / max(len(valores), 1),
+        }
+    return resultados
+
+# ---------------------------
+# Índice aprendido (modelo lineal por tramos de la CDF)
+# ---------------------------
+class IndiceAprendido:
+    """Aproxima la función clave -> posición con un modelo lineal por tramos.
+
+    Cada tramo cubre `tam_segmento` posiciones consecutivas y une su primera
+    y su última clave con una recta; al construir se mide el error máximo
+    de la recta dentro del tramo. Una búsqueda localiza el tramo (binaria
+    sobre las claves iniciales, n/tam_segmento elementos), predice la
+    posición y solo busca dentro de la ventana de error. Si la ventana no
+    contiene la respuesta (duplicados que cruzan tramos), se corrige con una
+    búsqueda acotada hacia el lado que falta.
+    """
+    def __init__(self, arreglo, tam_segmento=256):
+        self.datos = np.asarray(arreglo)
+        n = len(self.datos)
+        self.tam_segmento = tam_segmento
+        inicios = np.arange(0, n, tam_segmento, dtype=np.int64)
+        fines = np.minimum(inicios + tam_segmento, n) - 1
+        self.claves_inicio = self.datos[inicios]
+        k0 = self.claves_inicio.astype(np.float64)
+        k1 = self.datos[fines].astype(np.float64)
+        ancho = k1 - k0
+        self.pendiente = np.divide((fines - inicios).astype(np.float64), ancho,
+                                   out=np.zeros(len(inicios)), where=ancho > 0)
+        self.origen = inicios.astype(np.float64)
+
+        # Ventana de error por tramo: posicion ∈ [pred - err_alto, pred - err_bajo]
+        if n:
+            tramo = np.arange(n) // tam_segmento
+            pred = self.origen[tramo] + (self.datos.astype(np.float64) - k0[tramo]) * self.pendiente[tramo]
+            error = pred - np.arange(n)
+            self.err_alto = np.ceil(np.maximum.reduceat(error, inicios)).astype(np.int64)
+            self.err_bajo = np.floor(np.minimum.reduceat(error, inicios)).astype(np.int64)
+        else:
+            self.err_alto = self.err_bajo = np.zeros(0, dtype=np.int64)
+
+    def memoria_bytes(self):
+        """Tamaño del modelo (sin contar los datos)."""
+        return (self.claves_inicio.nbytes + self.pendiente.nbytes + self.origen.nbytes
+                + self.err_alto.nbytes + self.err_bajo.nbytes)
+
+    def _ventana(self, tramo, valor):
+        pred = self.origen[tramo] + (float(valor) - float(self.claves_inicio[tramo])) * self.pendiente[tramo]
+        n = len(self.datos)
+        lo = min(max(int(math.floor(pred - self.err_alto[tramo])), 0), n)
+        hi = min(max(int(math.ceil(pred - self.err_bajo[tramo])) + 1, lo), n)
+        return lo, hi
+
+    def limite_inferior(self, valor, datos=None, claves_inicio=None):
+        """Primer índice con datos[i] >= valor usando el modelo.
+
+        `datos` y `claves_inicio` permiten pasar envolturas (p. ej. para contar sondeos).
+        """
+        datos = self.datos if datos is None else datos
+        claves_inicio = self.claves_inicio if claves_inicio is None else claves_inicio
+        n = len(datos)
+        if n == 0:
+            return 0
+        tramo = max(limite_superior(claves_inicio, valor) - 1, 0)
+        lo, hi = self._ventana(tramo, valor)
+        j = limite_inferior(datos, valor, lo, hi)
+        # Corrección si la respuesta quedó fuera de la ventana
+        if j > 0 and j == lo and datos[j - 1] >= valor:
+            j = limite_inferior(datos, valor, 0, j)
+        elif j < n and j == hi and datos[j] < valor:
+            j = limite_inferior(datos, valor, j, n)
+        return j
+
+    def buscar(self, valor, datos=None, claves_inicio=None):
+        """Índice (la primera aparición) del valor o -1."""
+        datos = self.datos if datos is None else datos
+        j = self.limite_inferior(valor, datos, claves_inicio)
+        return j if j < len(datos) and datos[j] == valor else -1
+
+    def sondeos(self, valor):
+        """Accesos a memoria (modelo + datos) que hace una búsqueda."""
+        datos = _ListaContadora(self.datos)
+        claves = _ListaContadora(self.claves_inicio)
+        self.buscar(valor, datos, claves)
+        return datos.sondeos + claves.sondeos
+
+    def buscar_lote(self, valores):
+        """Versión vectorizada: binaria acotada a la ventana de cada consulta."""
+        valores = np.asarray(valores)
+        n = len(self.datos)
+        if n == 0:
+            return np.full(len(valores), -1, dtype=np.int64)
+        tramo = np.maximum(np.searchsorted(self.claves_inicio, valores, side="right") - 1, 0)
+        pred = self.origen[tramo] + (valores.astype(np.float64) - self.claves_inicio[tramo]) * self.pendiente[tramo]
+        lo = np.clip(np.floor(pred - self.err_alto[tramo]).astype(np.int64), 0, n)
+        hi = np.clip(np.ceil(pred - self.err_bajo[tramo]).astype(np.int64) + 1, lo, n)
+        izquierda, derecha = lo.copy(), hi.copy()
+        for _ in range(int(np.max(hi - lo, initial=0)).bit_length()):
+            activo = izquierda < derecha
+            medio = (izquierda + derecha) // 2
+            menor = self.datos[np.minimum(medio, n - 1)] < valores
+            izquierda = np.where(activo & menor, medio + 1, izquierda)
+            derecha = np.where(activo & ~menor, medio, derecha)
+        j = izquierda
+        # Consultas cuya respuesta quedó fuera de la ventana: búsqueda completa
+        fuera = ((j == lo) & (j > 0) & (self.datos[np.maximum(j - 1, 0)] >= valores)) | \
+                ((j == hi) & (j < n) & (self.datos[np.minimum(j, n - 1)] < valores))
+        if np.any(fuera):
+            j[fuera] = np.searchsorted(self.datos, valores[fuera], side="left")
+        encontrados = (j < n) & (self.datos[np.minimum(j, n - 1)] == valores)
+        return np.where(encontrados, j, -1).astype(np.int64)
+
+# ---------------------------
+# Columnas ordenadas en disco (memoria mapeada)
+# ---------------------------
+# Formato binario: cabecera fija de 64 bytes seguida de los valores crudos.
+#   magic (8 bytes) | dtype en texto NumPy, p. ej. "<i8" (8 bytes) | n (uint64) | relleno
+MAGIC_COLUMNA = b"BSQCOL1\0"
+TAM_CABECERA = 64
+
+def guardar_columna_ordenada(ruta, datos, tam_bloque=1 << 20):
+    """Escribe una columna ordenada de enteros en formato binario por bloques.
+
+    Verifica el orden mientras escribe (incluida la frontera entre bloques).
+    """
+    datos = np.asarray(datos)
+    if datos.ndim != 1 or datos.dtype.kind not in "iu":
+        raise ValueError("Se esperaba un arreglo 1D de enteros")
+    dtype = datos.dtype.newbyteorder("<") if datos.dtype.byteorder == ">" else datos.dtype
+    codigo = dtype.str.encode("ascii")
+    cabecera = MAGIC_COLUMNA + codigo.ljust(8, b"\0") + struct.pack("<Q", len(datos))
+    with open(ruta, "wb") as f:
+        f.write(cabecera.ljust(TAM_CABECERA, b"\0"))
+        anterior = None
+        for inicio in range(0, len(datos), tam_bloque):
+            bloque = np.ascontiguousarray(datos[inicio:inicio + tam_bloque], dtype=dtype)
+            if np.any(bloque[1:] < bloque[:-1]) or (anterior is not None and bloque[0] < anterior):
+                raise ValueError("Los datos no están ordenados")
+            anterior = bloque[-1]
+            bloque.tofile(f)
+
+def abrir_columna_ordenada(ruta):
+    """Abre una columna guardada con `guardar_columna_ordenada` como np.memmap de solo lectura.
+
+    No lee los datos: el sistema operativo carga solo las páginas que se tocan.
+    """
+    with open(ruta, "rb") as f:
+        cabecera = f.read(TAM_CABECERA)
+    if len(cabecera) < TAM_CABECERA or cabecera[:8] != MAGIC_COLUMNA:
+        raise ValueError("El archivo no es una columna ordenada válida")
+    dtype = np.dtype(cabecera[8:16].rstrip(b"\0").decode("ascii"))
+    (n,) = struct.unpack("<Q", cabecera[16:24])
+    if n == 0:
+        return np.array([], dtype=dtype)
+    return np.memmap(ruta, dtype=dtype, mode="r", offset=TAM_CABECERA, shape=(n,))
+
+def busqueda_lineal_por_bloques(arreglo, valor, tam_bloque=1 << 20):
+    """Búsqueda lineal por bloques vectorizados; sirve para np.memmap sin cargarlo entero."""
+    for inicio in range(0, len(arreglo), tam_bloque):
+        coincidencias = np.flatnonzero(arreglo[inicio:inicio + tam_bloque] == valor)
+        if len(coincidencias):
+            return inicio + int(coincidencias[0])
+    return -1
+
+# ---------------------------
+# Índice hash con direccionamiento abierto (datos que cambian)
+# ---------------------------
+_MASCARA_64 = (1 << 64) - 1
+_FIBONACCI_64 = 0x9E3779B97F4A7C15  # 2^64 / φ, hash multiplicativo
+_VACIO, _OCUPADO, _BORRADO = 0, 1, 2
+
+class IndiceHash:
+    """Índice clave -> posición sobre arreglos NumPy con sondeo lineal.
+
+    Insertar, eliminar y buscar cuestan O(1) en promedio; al contrario que la
+    búsqueda binaria no exige reordenar los datos cuando cambian. Las
+    eliminaciones dejan una marca de borrado para no romper las cadenas de
+    sondeo; la tabla se reconstruye al doble al superar `carga_max`.
+    """
+    def __init__(self, capacidad=8, carga_max=0.5):
+        self.carga_max = carga_max
+        self._reservar(max(8, 1 << (int(capacidad) - 1).bit_length()))
+
+    def _reservar(self, capacidad):
+        self.bits = capacidad.bit_length() - 1
+        self.mascara = capacidad - 1
+        self.claves = np.zeros(capacidad, dtype=np.int64)
+        self.valores = np.zeros(capacidad, dtype=np.int64)
+        self.estado = np.zeros(capacidad, dtype=np.int8)
+        self.ocupados = 0
+        self.borrados = 0
+
+    @classmethod
+    def desde_arreglo(cls, arreglo, carga_max=0.5):
+        """Construye el índice (valor -> primer índice) con inserciones vectorizadas, sin ordenar.
+
+        En cada ronda, de las claves pendientes que caen en una casilla libre
+        gana la de menor posición en el arreglo. Después toda casilla mirada
+        está ocupada: si guarda la misma clave, la pendiente es un duplicado
+        y se descarta; si no, avanza una posición como en el sondeo lineal
+        escalar. La tabla se dimensiona para len(arreglo) claves porque no se
+        sabe cuántas distintas hay sin recorrerlas antes.
+        """
+        claves = np.asarray(arreglo, dtype=np.int64)
+        indice = cls(capacidad=int(len(claves) / carga_max) + 1, carga_max=carga_max)
+        valores = np.arange(len(claves), dtype=np.int64)
+        casillas = indice._hash_lote(claves)
+        while len(claves):
+            libres = np.flatnonzero(indice.estado[casillas] == _VACIO)
+            # Con índices repetidos gana la última asignación: en orden inverso
+            # gana el primero, y su posición ya queda escrita en `valores`
+            indice.valores[casillas[libres[::-1]]] = valores[libres[::-1]]
+            ganadores = libres[indice.valores[casillas[libres]] == valores[libres]]
+            destino = casillas[ganadores]
+            indice.estado[destino] = _OCUPADO
+            indice.claves[destino] = claves[ganadores]
+            # Los ganadores coinciden consigo mismos y también salen
+            sigue = indice.claves[casillas] != claves
+            claves, valores = claves[sigue], valores[sigue]
+            casillas = (casillas[sigue] + 1) & indice.mascara
+        indice.ocupados = int(np.count_nonzero(indice.estado == _OCUPADO))
+        return indice
+
+    def _hash(self, clave):
+        return ((int(clave) & _MASCARA_64) * _FIBONACCI_64 & _MASCARA_64) >> (64 - self.bits)
+
+    def _hash_lote(self, claves):
+        producto = np.asarray(claves, dtype=np.int64).view(np.uint64) * np.uint64(_FIBONACCI_64)
+        return (producto >> np.uint64(64 - self.bits)).astype(np.int64)
+
+    def buscar(self, clave):
+        """Posición asociada a la clave o -1."""
+        i = self._hash(clave)
+        while self.estado[i] != _VACIO:
+            if self.estado[i] == _OCUPADO and self.claves[i] == clave:
+                return int(self.valores[i])
+            i = (i + 1) & self.mascara
+        return -1
+
+    def buscar_lote(self, claves):
+        """Búsqueda vectorizada: todas las consultas avanzan una casilla por ronda."""
+        claves = np.asarray(claves, dtype=np.int64)
+        resultado = np.full(len(claves), -1, dtype=np.int64)
+        pendientes = np.arange(len(claves))
+        casillas = self._hash_lote(claves)
+        while len(pendientes):
+            estado = self.estado[casillas]
+            acierto = (estado == _OCUPADO) & (self.claves[casillas] == claves[pendientes])
+            resultado[pendientes[acierto]] = self.valores[casillas[acierto]]
+            sigue = (estado != _VACIO) & ~acierto
+            pendientes = pendientes[sigue]
+            casillas = (casillas[sigue] + 1) & self.mascara
+        return resultado
+
+    def insertar(self, clave, valor):
+        """Asocia clave -> valor (reemplaza el valor si la clave ya existe)."""
+        if self.ocupados + self.borrados + 1 > self.carga_max * len(self.estado):
+            self._redimensionar()
+        i = self._hash(clave)
+        hueco = -1
+        while self.estado[i] != _VACIO:
+            if self.estado[i] == _OCUPADO and self.claves[i] == clave:
+                self.valores[i] = valor
+                return
+            if self.estado[i] == _BORRADO and hueco == -1:
+                hueco = i
+            i = (i + 1) & self.mascara
+        if hueco != -1:
+            i = hueco
+            self.borrados -= 1
+        self.estado[i] = _OCUPADO
+        self.claves[i] = clave
+        self.valores[i] = valor
+        self.ocupados += 1
+
+    def eliminar(self, clave):
+        """Quita la clave; devuelve True si existía."""
+        i = self._hash(clave)
+        while self.estado[i] != _VACIO:
+            if self.estado[i] == _OCUPADO and self.claves[i] == clave:
+                self.estado[i] = _BORRADO
+                self.ocupados -= 1
+                self.borrados += 1
+                return True
+            i = (i + 1) & self.mascara
+        return False
+
+    def _redimensionar(self):
+        vivos = self.estado == _OCUPADO
+        claves, valores = self.claves[vivos], self.valores[vivos]
+        # Solo se duplica si hace falta; si sobran borrados basta con limpiar
+        capacidad = len(self.estado)
+        if self.ocupados + 1 > self.carga_max * capacidad / 2:
+            capacidad *= 2
+        self._reservar(capacidad)
+        for clave, valor in zip(claves.tolist(), valores.tolist()):
+            self.insertar(clave, valor)
+
+    def __len__(self):
+        return self.ocupados
+
+    def __contains__(self, clave):
+        return self.buscar(clave) != -1
+
+    def memoria_bytes(self):
+        return self.claves.nbytes + self.valores.nbytes + self.estado.nbytes
+
+def costo_indice_hash(arreglo, consultas, duracion_objetivo=0.2, semilla=0):
+    """Compara el costo de construir el índice hash con lo que ahorra por consulta y por actualización.
+
+    Referencias: búsqueda lineal sin índice (datos sin ordenar) y ordenar una
+    vez + búsqueda binaria. Para datos que cambian se compara una
+    actualización del índice (insertar o eliminar) con volver a ordenar el
+    arreglo tras añadir un elemento. Tiempos en segundos; los
+    "punto_equilibrio" son el número de consultas (o de actualizaciones) a
+    partir del cual el índice hash sale más barato (inf si nunca). `arreglo`
+    puede venir ya ordenado (como self.arreglo): todo se mide sobre una
+    permutación suya, si no ordenar saldría casi gratis.
+    """
+    arreglo = np.random.default_rng(semilla).permutation(np.asarray(arreglo))
+    consultas = np.asarray(consultas)
+    n_consultas = max(len(consultas), 1)
+    construccion = medir_tiempo(IndiceHash.desde_arreglo, arreglo, calentamiento=1,
+                                duracion_objetivo=duracion_objetivo, min_muestras=3)["mediana"]
+    # np.sort devuelve una copia, así que cada muestra ordena los datos desordenados
+    ordenar = medir_tiempo(np.sort, arreglo, calentamiento=1,
+                           duracion_objetivo=duracion_objetivo, min_muestras=3)["mediana"]
+    indice = IndiceHash.desde_arreglo(arreglo)
+    ordenado = np.sort(arreglo)
+    consulta_hash = medir_tiempo(indice.buscar_lote, consultas,
+                                 duracion_objetivo=duracion_objetivo)["mediana"] / n_consultas
+    consulta_binaria = medir_tiempo(busqueda_binaria_lote, ordenado, consultas,
+                                    duracion_objetivo=duracion_objetivo)["mediana"] / n_consultas
+    # La lineal es muy cara: se estima con pocas consultas
+    muestra = consultas[:min(len(consultas), 32)]
+    consulta_lineal = medir_tiempo(
+        lambda: [busqueda_lineal_por_bloques(arreglo, v) for v in muestra],
+        calentamiento=1, duracion_objetivo=duracion_objetivo, min_muestras=3,
+    )["mediana"] / max(len(muestra), 1)
+
+    # Actualizaciones: claves nuevas que se insertan y se vuelven a eliminar,
+    # así el índice queda igual tras cada muestra
+    nuevas = (np.max(arreglo) + 1 + np.arange(64)).tolist() if len(arreglo) else list(range(64))
+
+    def actualizar():
+        for clave in nuevas:
+            indice.insertar(clave, -1)
+        for clave in nuevas:
+            indice.eliminar(clave)
+
+    actualizacion_hash = medir_tiempo(actualizar, calentamiento=1, duracion_objetivo=duracion_objetivo,
+                                      min_muestras=3)["mediana"] / (2 * len(nuevas))
+    reordenar = medir_tiempo(lambda: np.sort(np.append(ordenado, nuevas[0])), calentamiento=1,
+                             duracion_objetivo=duracion_objetivo, min_muestras=3)["mediana"]
+
+    def equilibrio(costo_fijo_extra, ahorro_por_consulta):
+        if costo_fijo_extra <= 0:
+            return 0.0
+        return costo_fijo_extra / ahorro_por_consulta if ahorro_por_consulta > 0 else math.inf
+
+    return {
+        "construccion": construccion,
+        "ordenar": ordenar,
+        "consulta_hash": consulta_hash,
+        "consulta_binaria": consulta_binaria,
+        "consulta_lineal": consulta_lineal,
+        "memoria_bytes": indice.memoria_bytes(),
+        "punto_equilibrio_lineal": equilibrio(construccion, consulta_lineal - consulta_hash),
+        "punto_equilibrio_binaria": equilibrio(construccion - ordenar, consulta_binaria - consulta_hash),
+        "actualizacion_hash": actualizacion_hash,
+        "reordenar": reordenar,
+        "punto_equilibrio_actualizaciones": equilibrio(construccion - ordenar, reordenar - actualizacion_hash),
+    }
+
+# ---------------------------
+# Filtro de Bloom para descartar búsquedas negativas
+# ---------------------------
+def _mezclar64(x):
+    """splitmix64 sobre enteros de Python (resultado en [0, 2^64))."""
+    x = (x + 0x9E3779B97F4A7C15) & _MASCARA_64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASCARA_64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASCARA_64
+    return x ^ (x >> 31)
+
+def _mezclar64_lote(x):
+    """splitmix64 vectorizado (la aritmética uint64 de NumPy ya es módulo 2^64)."""
+    x = x + np.uint64(0x9E3779B97F4A7C15)
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+class FiltroBloom:
+    """Filtro de Bloom compacto: "no está" es seguro, "puede estar" falla con tasa ~`tasa_fp`.
+
+    Usa m = -n·ln(p)/ln(2)^2 bits y k = m/n·ln(2) funciones hash obtenidas
+    por doble hashing (h1 + i·h2) a partir de splitmix64.
+    """
+    def __init__(self, n_esperado, tasa_fp=0.01):
+        n_esperado = max(int(n_esperado), 1)
+        self.tasa_fp = tasa_fp
+        self.m = max(64, int(math.ceil(-n_esperado * math.log(tasa_fp) / math.log(2) ** 2)))
+        self.k = max(1, int(round(self.m / n_esperado * math.log(2))))
+        self.bits = np.zeros((self.m + 7) // 8, dtype=np.uint8)
+
+    @classmethod
+    def desde_arreglo(cls, arreglo, tasa_fp=0.01):
+        arreglo = np.asarray(arreglo)
+        filtro = cls(len(np.unique(arreglo)) if len(arreglo) else 1, tasa_fp)
+        filtro.agregar_lote(arreglo)
+        return filtro
+
+    def _posiciones_lote(self, claves):
+        x = np.asarray(claves, dtype=np.int64).view(np.uint64)
+        h1 = _mezclar64_lote(x)
+        h2 = _mezclar64_lote(x ^ np.uint64(0x5BD1E9955BD1E995)) | np.uint64(1)
+        i = np.arange(self.k, dtype=np.uint64)
+        return ((h1[:, None] + i[None, :] * h2[:, None]) % np.uint64(self.m)).astype(np.int64)
+
+    def agregar_lote(self, claves):
+        posiciones = self._posiciones_lote(claves).ravel()
+        np.bitwise_or.at(self.bits, posiciones >> 3, (1 << (posiciones & 7)).astype(np.uint8))
+
+    def contiene(self, clave):
+        # Las posiciones se generan una a una para salir en el primer bit apagado
+        x = int(clave) & _MASCARA_64
+        h = _mezclar64(x)
+        h2 = _mezclar64(x ^ 0x5BD1E9955BD1E995) | 1
+        bits, m = self.bits, self.m
+        for _ in range(self.k):
+            p = h % m
+            if not bits[p >> 3] & (1 << (p & 7)):
+                return False
+            h = (h + h2) & _MASCARA_64
+        return True
+
+    def contiene_lote(self, claves):
+        posiciones = self._posiciones_lote(claves)
+        return np.all((self.bits[posiciones >> 3] >> (posiciones & 7)) & 1, axis=1)
+
+    def memoria_bytes(self):
+        return self.bits.nbytes
+
+def busqueda_con_filtro(filtro, algoritmo, lista, valor):
+    """Consulta primero el filtro de Bloom; solo busca si el valor puede estar."""
+    if not filtro.contiene(valor):
+        return -1
+    return algoritmo(lista, valor)
+
+# ---------------------------
+# Búsqueda lineal paralela sobre memoria compartida (datos sin ordenar)
+# ---------------------------
+# Estado de cada proceso trabajador: el arreglo se adjunta una sola vez desde
+# la memoria compartida, así que nunca se serializa (pickle) el contenido.
+_trabajador = {}
+
+def _iniciar_trabajador(nombre_shm, n, dtype, mejor):
+    shm = shared_memory.SharedMemory(name=nombre_shm)
+    _trabajador["shm"] = shm
+    _trabajador["arreglo"] = np.ndarray((n,), dtype=np.dtype(dtype), buffer=shm.buf)
+    _trabajador["mejor"] = mejor
+
+def _buscar_trozo(inicio, fin, valor, tam_bloque):
+    """Recorre [inicio, fin) por bloques; se detiene si otro trabajador ya encontró un índice menor."""
+    arreglo = _trabajador["arreglo"]
+    mejor = _trabajador["mejor"]
+    for bloque in range(inicio, fin, tam_bloque):
+        if mejor.value < bloque:
+            return  # ya hay una coincidencia antes de este bloque
+        coincidencias = np.flatnonzero(arreglo[bloque:min(bloque + tam_bloque, fin)] == valor)
+        if len(coincidencias):
+            indice = bloque + int(coincidencias[0])
+            with mejor.get_lock():
+                if indice < mejor.value:
+                    mejor.value = indice
+            return
+
+class BuscadorLinealParalelo:
+    """Búsqueda lineal repartida en trozos contiguos entre un pool de procesos.
+
+    Los datos se copian una vez a memoria compartida y el pool se crea una
+    sola vez, así cada búsqueda solo envía (inicio, fin, valor). Devuelve el
+    primer índice, igual que `busqueda_lineal`, con parada temprana entre
+    trabajadores. Usar como gestor de contexto para liberar la memoria.
+    """
+    def __init__(self, arreglo, procesos=None, tam_bloque=1 << 16):
+        arreglo = np.ascontiguousarray(arreglo)
+        self.n = len(arreglo)
+        self.procesos = procesos or os.cpu_count() or 1
+        self.tam_bloque = tam_bloque
+        self.shm = shared_memory.SharedMemory(create=True, size=max(arreglo.nbytes, 1))
+        np.ndarray(arreglo.shape, dtype=arreglo.dtype, buffer=self.shm.buf)[:] = arreglo
+        self.mejor = mp.Value("q", self.n)
+        self.pool = mp.Pool(self.procesos, initializer=_iniciar_trabajador,
+                            initargs=(self.shm.name, self.n, arreglo.dtype.str, self.mejor))
+
+    def buscar(self, valor):
+        self.mejor.value = self.n  # centinela: sin coincidencias
+        limites = np.linspace(0, self.n, self.procesos + 1).astype(np.int64)
+        tareas = [(int(limites[i]), int(limites[i + 1]), valor, self.tam_bloque)
+                  for i in range(self.procesos) if limites[i] < limites[i + 1]]
+        self.pool.starmap(_buscar_trozo, tareas)
+        indice = self.mejor.value
+        return -1 if indice >= self.n else indice
+
+    def cerrar(self):
+        self.pool.close()
+        self.pool.join()
+        self.shm.close()
+        self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+def escalamiento_busqueda_paralela(arreglo, valor, procesos=(1, 2, 4, 8), duracion_objetivo=0.5):
+    """Mide la búsqueda paralela con distintos números de procesos.
+
+    Devuelve filas (procesos, mediana_s, aceleracion, eficiencia) tomando
+    como referencia la ejecución con el primer número de procesos de la lista.
+    """
+    filas = []
+    base = None
+    for p in procesos:
+        with BuscadorLinealParalelo(arreglo, procesos=p) as buscador:
+            stats = medir_tiempo(buscador.buscar, valor, calentamiento=1,
+                                 duracion_objetivo=duracion_objetivo, min_muestras=5)
+        tiempo = stats["mediana"]
+        if base is None:
+            base = tiempo * procesos[0]
+        aceleracion = base / tiempo
+        filas.append((p, tiempo, aceleracion, aceleracion / p))
+    return filas
+
+# ---------------------------
+# Layout Eytzinger (orden BFS) para búsqueda binaria amigable con la caché
+# ---------------------------
+# El árbol binario implícito se guarda por niveles: la raíz en la posición 1
+# y los hijos de k en 2k y 2k+1. Los primeros niveles (los que visitan todas
+# las búsquedas) quedan juntos en memoria y caben en pocas líneas de caché.
+def construir_eytzinger(arreglo):
+    """Reordena un arreglo ordenado al layout Eytzinger.
+
+    Devuelve (eytz, posiciones): eytz[1..n] con los valores en orden BFS
+    (eytz[0] no se usa) y posiciones[k] = índice original de eytz[k].
+    """
+    arreglo = np.asarray(arreglo)
+    n = len(arreglo)
+    k = np.arange(1, n + 1, dtype=np.int64)
+    # Profundidad de cada nodo = bit_length(k) - 1 (exacto para n < 2**53)
+    profundidad = np.frexp(k.astype(np.float64))[1].astype(np.int64) - 1
+    altura = int(profundidad[-1]) if n else 0
+    # El recorrido en orden coincide con ordenar por la "fracción" del camino:
+    # (2k + 1) desplazado a la misma escala para todos los niveles.
+    claves = (2 * k + 1) << (altura - profundidad)
+    en_orden = np.argsort(claves, kind="stable")
+    del claves, profundidad, k
+
+    eytz = np.empty(n + 1, dtype=arreglo.dtype)
+    eytz[0] = 0
+    eytz[en_orden + 1] = arreglo
+    tipo_pos = np.int32 if n < 2**31 else np.int64
+    posiciones = np.full(n + 1, -1, dtype=tipo_pos)
+    posiciones[en_orden + 1] = np.arange(n, dtype=tipo_pos)
+    return eytz, posiciones
+
+def busqueda_eytzinger(eytz, posiciones, valor):
+    """Búsqueda sobre el layout Eytzinger; devuelve el índice original o -1."""
+    n = len(eytz) - 1
+    k = 1
+    while k <= n:
+        k = 2 * k + int(eytz[k] < valor)
+    # Deshacer los giros a la derecha finales: k >>= ffs(~k)
+    k >>= ((~k) & (k + 1)).bit_length()
+    if k == 0 or eytz[k] != valor:
+        return -1
+    return int(posiciones[k])
+
+def busqueda_eytzinger_lote(eytz, posiciones, valores):
+    """Versión vectorizada: desciende un nivel del árbol por iteración para todas las consultas."""
+    n = len(eytz) - 1
+    valores = np.asarray(valores)
+    if n == 0:
+        return np.full(len(valores), -1, dtype=np.int64)
+    k = np.ones(len(valores), dtype=np.int64)
+    altura = n.bit_length() - 1
+    for _ in range(altura + 1):
+        dentro = k <= n
+        k = np.where(dentro, 2 * k + (eytz[np.minimum(k, n)] < valores), k)
+    # Bit cero más bajo de k (potencia de 2 exacta) → cuántos bits descartar
+    bajo_cero = (~k) & (k + 1)
+    k >>= np.log2(bajo_cero).astype(np.int64) + 1
+    encontrados = (k > 0) & (eytz[k] == valores)
+    return np.where(encontrados, posiciones[k], -1).astype(np.int64)
+
+# Pico de comparar_layouts por elemento: el arreglo, los temporales de
+# construir_eytzinger (claves, profundidad, orden) y eytz + posiciones.
+# Medido con tracemalloc ronda los 40 bytes; se deja algo de margen.
+BYTES_POR_ELEMENTO_LAYOUT = 48
+
+def memoria_disponible():
+    """Bytes de RAM disponibles según el sistema, o None si no se puede saber."""
+    try:
+        with open("/proc/meminfo") as f:
+            for linea in f:
+                if linea.startswith("MemAvailable:"):
+                    return int(linea.split()[1]) * 1024
+    except (OSError, ValueError):
+        pass
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, ValueError, OSError):
+        return None
+
+def comparar_layouts(tamanos, n_consultas=100000, duracion_objetivo=0.2, semilla=None, memoria_max=None):
+    """Compara búsqueda por lote en layout ordenado clásico contra Eytzinger.
+
+    Devuelve {nombre_layout: [(n, mediana_ms, ic_inf_ms, ic_sup_ms), ...]}
+    con tiempos por consulta. Se detiene en el primer tamaño que no cabe en
+    memoria: el que según BYTES_POR_ELEMENTO_LAYOUT pasaría de `memoria_max`
+    bytes o, si no hay límite, el que lanza MemoryError. El límite importa
+    porque al agotar la RAM el sistema suele matar el proceso sin que
+    llegue a haber MemoryError.
+    """
+    rng = np.random.default_rng(semilla)
+    resultados = {"Clásico": [], "Eytzinger": []}
+    for n in tamanos:
+        if memoria_max is not None and n * BYTES_POR_ELEMENTO_LAYOUT > memoria_max:
+            break
+        try:
+            arreglo = np.sort(rng.integers(0, 4 * n, n))
+            eytz, posiciones = construir_eytzinger(arreglo)
+        except MemoryError:
+            break
+        consultas = rng.integers(0, 4 * n, n_consultas)
+        for nombre, funcion, args in (
+            ("Clásico", busqueda_binaria_lote, (arreglo, consultas)),
+            ("Eytzinger", busqueda_eytzinger_lote, (eytz, posiciones, consultas)),
+        ):
+            stats = medir_tiempo(funcion, *args, calentamiento=1, duracion_objetivo=duracion_objetivo, min_muestras=3)
+            resultados[nombre].append((n,
+                                       stats["mediana"] * 1000 / n_consultas,
+                                       stats["ic_inf"] * 1000 / n_consultas,
+                                       stats["ic_sup"] * 1000 / n_consultas))
+        del arreglo, eytz, posiciones
+    return resultados
+
+# ---------------------------
+# Motor de medición de tiempos
+# ---------------------------
+def medir_tiempo(funcion, *args, calentamiento=3, duracion_objetivo=0.2,
+                 min_muestras=7, max_muestras=1000, resolucion_min=1e-4,
+                 desactivar_gc=True):
+    """Mide funcion(*args) de forma estadísticamente robusta.
+
+    - Calentamiento: unas llamadas previas que no se miden.
+    - Cada muestra agrupa tantas llamadas como hagan falta para superar
+      `resolucion_min` segundos (evita medir solo ruido del reloj).
+    - Se toman muestras hasta alcanzar `duracion_objetivo` segundos en total
+      (con un mínimo de `min_muestras`).
+    - El recolector de basura se apaga durante la medición si se pide.
+
+    Devuelve un diccionario con tiempos por llamada en segundos:
+    mediana, q1, q3, iqr, ic_inf/ic_sup (IC ~95% de la mediana por
+    estadísticos de orden), muestras y llamadas_por_muestra.
+    """
+    for _ in range(calentamiento):
+        funcion(*args)
+
+    gc_activo = gc.isenabled()
+    if desactivar_gc:
+        gc.disable()
+    try:
+        # Calibración: duplicar llamadas por muestra hasta superar la resolución
+        llamadas = 1
+        while True:
+            inicio = time.perf_counter()
+            for _ in range(llamadas):
+                funcion(*args)
+            transcurrido = time.perf_counter() - inicio
+            if transcurrido >= resolucion_min or llamadas >= 1 << 20:
+                break
+            llamadas *= 2
+
+        muestras = [transcurrido / llamadas]
+        total = transcurrido
+        while len(muestras) < max_muestras and (len(muestras) < min_muestras or total < duracion_objetivo):
+            inicio = time.perf_counter()
+            for _ in range(llamadas):
+                funcion(*args)
+            transcurrido = time.perf_counter() - inicio
+            muestras.append(transcurrido / llamadas)
+            total += transcurrido
+    finally:
+        if desactivar_gc and gc_activo:
+            gc.enable()
+
+    datos = np.sort(np.array(muestras))
+    n = len(datos)
+    mediana = float(np.median(datos))
+    q1, q3 = (float(q) for q in np.percentile(datos, [25, 75]))
+    # IC no paramétrico de la mediana: rangos n/2 ± 1.96·sqrt(n)/2
+    delta = 1.96 * math.sqrt(n) / 2
+    bajo = max(0, int(math.floor(n / 2 - delta)))
+    alto = min(n - 1, int(math.ceil(n / 2 + delta)))
+    return {
+        "mediana": mediana,
+        "q1": q1,
+        "q3": q3,
+        "iqr": q3 - q1,
+        "ic_inf": float(datos[bajo]),
+        "ic_sup": float(datos[alto]),
+        "muestras": n,
+        "llamadas_por_muestra": llamadas,
+    }
+
+# ---------------------------
+# Generador de cargas de consultas
+# ---------------------------
+DISTRIBUCIONES_CARGA = ("uniforme", "zipf", "secuencial")
+
+def _valores_ausentes(claves, k, rng, intentos=8):
+    """k valores que no están en `claves` (ordenadas y sin repetir).
+
+    Primero se intenta dentro del rango de los datos; si los datos son tan
+    densos que casi no hay huecos, el resto se toma por encima del máximo.
+    """
+    if k == 0:
+        return np.array([], dtype=np.int64)
+    bajo, alto = int(claves[0]), int(claves[-1])
+    ausentes = np.array([], dtype=np.int64)
+    for _ in range(intentos):
+        candidatos = rng.integers(bajo, alto + 1, 2 * k)
+        pos = np.minimum(np.searchsorted(claves, candidatos), len(claves) - 1)
+        ausentes = np.concatenate([ausentes, candidatos[claves[pos] != candidatos]])
+        if len(ausentes) >= k:
+            return ausentes[:k]
+    relleno = alto + 1 + rng.integers(0, max(len(claves), 1), k - len(ausentes))
+    return np.concatenate([ausentes, relleno])
+
+def generar_carga(arreglo, n_consultas, distribucion="uniforme", proporcion_fallos=0.0,
+                  s_zipf=1.1, rng=None):
+    """Genera un flujo de consultas sobre un arreglo ordenado.
+
+    - "uniforme": posiciones al azar (las claves repetidas salen más).
+    - "zipf": la clave de rango r (popularidad asignada al azar) sale con
+      probabilidad ∝ 1/r^s_zipf; unas pocas claves calientes dominan.
+    - "secuencial": posiciones crecientes (recorrido monótono de la tabla).
+    Una fracción `proporcion_fallos` de las consultas, en posiciones al azar
+    del flujo, se sustituye por valores ausentes.
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    arreglo = np.asarray(arreglo)
+    n = len(arreglo)
+    if distribucion == "uniforme":
+        consultas = arreglo[rng.integers(0, n, n_consultas)].astype(np.int64)
+    elif distribucion == "zipf":
+        claves = np.unique(arreglo)
+        pesos = np.arange(1, len(claves) + 1, dtype=np.float64) ** -s_zipf
+        cdf = np.cumsum(pesos)
+        rangos = np.minimum(np.searchsorted(cdf, rng.random(n_consultas) * cdf[-1]), len(claves) - 1)
+        popularidad = rng.permutation(len(claves))
+        consultas = claves[popularidad[rangos]].astype(np.int64)
+    elif distribucion == "secuencial":
+        consultas = arreglo[np.sort(rng.integers(0, n, n_consultas))].astype(np.int64)
+    else:
+        raise ValueError(f"Distribución no soportada: {distribucion}")
+
+    fallos = rng.random(n_consultas) < proporcion_fallos
+    n_fallos = int(np.count_nonzero(fallos))
+    if n_fallos:
+        consultas[fallos] = _valores_ausentes(np.unique(arreglo), n_fallos, rng)
+    return consultas
+
+def reproducir_carga(buscadores, consultas, repeticiones_reloj=1000):
+    """Reproduce el flujo de consultas en cada buscador (nombre -> función(valor)).
+
+    Hace dos pasadas: una sin instrumentar para el throughput y otra midiendo
+    cada consulta con perf_counter_ns (descontando el costo del propio reloj)
+    para los percentiles. Devuelve {nombre: {consultas_por_seg, p50_ns,
+    p99_ns, media_ns}}.
+    """
+    reloj = time.perf_counter_ns
+    costo_reloj = float(np.median([-(reloj() - reloj()) for _ in range(repeticiones_reloj)]))
+    resultados = {}
+    gc_activo = gc.isenabled()
+    gc.disable()
+    try:
+        for nombre, buscar in buscadores.items():
+            inicio = time.perf_counter()
+            for v in consultas:
+                buscar(v)
+            total = time.perf_counter() - inicio
+
+            latencias = np.empty(len(consultas), dtype=np.float64)
+            for i, v in enumerate(consultas):
+                t0 = reloj()
+                buscar(v)
+                latencias[i] = reloj() - t0
+            latencias = np.maximum(latencias - costo_reloj, 0)
+            p50, p99 = np.percentile(latencias, [50, 99])
+            resultados[nombre] = {
+                "consultas_por_seg": len(consultas) / total if total > 0 else math.inf,
+                "p50_ns": float(p50),
+                "p99_ns": float(p99),
+                "media_ns": float(latencias.mean()),
+            }
+    finally:
+        if gc_activo:
+            gc.enable()
+    return resultados
+
+# ---------------------------
+# Benchmark sin interfaz gráfica
+# ---------------------------
+def datos_benchmark(n, rng):
+    """Arreglo ordenado de n claves pares en [0, 4n) (los impares quedan libres para fallos)."""
+    return np.sort(rng.integers(0, 2 * n, n) * 2)
+
+def _por_consulta(algoritmo):
+    """Adapta una búsqueda escalar para recorrer un arreglo de consultas."""
+    def buscar(datos, consultas):
+        return [algoritmo(datos, v) for v in consultas]
+    return buscar
+
+def _sin_preparar(arreglo):
+    return arreglo
+
+def _a_lista(arreglo):
+    return arreglo.tolist()
+
+def _a_memoryview(arreglo):
+    return memoryview(np.ascontiguousarray(arreglo))
+
+# nombre -> (preparar datos, buscar todas las consultas, consultas como lista de Python)
+ALGORITMOS_BENCHMARK = {
+    "lineal": (_a_lista, _por_consulta(busqueda_lineal), True),
+    "binaria": (_a_lista, _por_consulta(busqueda_binaria), True),
+    "binaria_tipada": (_a_memoryview, _por_consulta(busqueda_binaria), True),
+    "interpolacion": (_a_lista, _por_consulta(busqueda_interpolacion), True),
+    "exponencial": (_a_lista, _por_consulta(busqueda_exponencial), True),
+    "galope": (_a_lista, _por_consulta(busqueda_galope), True),
+    "lote": (_sin_preparar, busqueda_binaria_lote, False),
+    "eytzinger_lote": (construir_eytzinger, lambda datos, consultas: busqueda_eytzinger_lote(*datos, consultas), False),
+    "aprendido_lote": (IndiceAprendido, lambda indice, consultas: indice.buscar_lote(consultas), False),
+}
+
+# Por encima de este tamaño los algoritmos que trabajan sobre una lista de
+# Python se omiten: tolist() de 10^8 enteros ocupa varios GB
+MAX_N_LISTA = 10**7
+
+def ejecutar_benchmark(tamanos, proporciones_aciertos, consultas_por_punto, algoritmos,
+                       duracion_objetivo=0.5, semilla=None, progreso=None, distribuciones=("uniforme",),
+                       tipo="int64", max_n_lista=MAX_N_LISTA):
+    """Barre tamaños × distribución × proporción de aciertos × número de consultas × algoritmo.
+
+    Devuelve una lista de filas (diccionarios) con latencia por consulta en
+    nanosegundos y throughput en consultas por segundo. Los algoritmos que
+    necesitan una lista de Python se saltan (con aviso) si n > max_n_lista.
+    """
+    rng = np.random.default_rng(semilla)
+    filas = []
+    for n in tamanos:
+        arreglo = datos_benchmark(n, rng).astype(BACKENDS_DATOS[tipo])
+        for nombre in algoritmos:
+            preparar, buscar, usa_lista = ALGORITMOS_BENCHMARK[nombre]
+            if usa_lista and n > max_n_lista:
+                print(f"{nombre}\tn={n}\tomitido: la lista de Python no cabe en memoria "
+                      f"(máximo {max_n_lista})", file=sys.stderr)
+                continue
+            inicio = time.perf_counter()
+            datos = preparar(arreglo)
+            tiempo_preparacion = time.perf_counter() - inicio
+            for distribucion in distribuciones:
+                for proporcion in proporciones_aciertos:
+                    for n_consultas in consultas_por_punto:
+                        consultas = generar_carga(arreglo, n_consultas, distribucion, 1 - proporcion, rng=rng)
+                        if usa_lista:
+                            consultas = consultas.tolist()
+                        stats = medir_tiempo(buscar, datos, consultas, calentamiento=1,
+                                             duracion_objetivo=duracion_objetivo, min_muestras=3)
+                        fila = {
+                            "algoritmo": nombre,
+                            "tamano": n,
+                            "distribucion": distribucion,
+                            "tipo": tipo,
+                            "proporcion_aciertos": proporcion,
+                            "consultas": n_consultas,
+                            "mediana_ns": stats["mediana"] * 1e9 / n_consultas,
+                            "ic_inf_ns": stats["ic_inf"] * 1e9 / n_consultas,
+                            "ic_sup_ns": stats["ic_sup"] * 1e9 / n_consultas,
+                            "iqr_ns": stats["iqr"] * 1e9 / n_consultas,
+                            "consultas_por_seg": n_consultas / stats["mediana"],
+                            "muestras": stats["muestras"],
+                            "preparacion_s": tiempo_preparacion,
+                        }
+                        filas.append(fila)
+                        if progreso:
+                            progreso(fila)
+            del datos
+    return filas
+
+def escribir_resultados(filas, salida, formato):
+    """Escribe las filas en JSON (con metadatos del entorno) o CSV."""
+    if formato == "json":
+        documento = {
+            "entorno": {
+                "python": platform.python_version(),
+                "numpy": np.__version__,
+                "plataforma": platform.platform(),
+                "procesador": platform.processor(),
+            },
+            "resultados": filas,
+        }
+        json.dump(documento, salida, indent=2)
+        salida.write("\n")
+    else:
+        escritor = csv.DictWriter(salida, fieldnames=list(filas[0].keys()) if filas else [])
+        escritor.writeheader()
+        escritor.writerows(filas)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Comparación de algoritmos de búsqueda. Sin --benchmark abre la interfaz gráfica."
+    )
+    parser.add_argument("--benchmark", action="store_true", help="Ejecuta el barrido sin interfaz gráfica")
+    parser.add_argument("--tamanos", type=int, nargs="+", default=[10**3, 10**4, 10**5, 10**6, 10**7])
+    parser.add_argument("--aciertos", type=float, nargs="+", default=[0.0, 0.5, 1.0],
+                        help="Proporciones de consultas que sí están en la lista")
+    parser.add_argument("--consultas", type=int, nargs="+", default=[100000])
+    parser.add_argument("--distribuciones", nargs="+", default=["uniforme"], choices=DISTRIBUCIONES_CARGA,
+                        help="Distribución de las consultas acertadas")
+    parser.add_argument("--algoritmos", nargs="+", default=["binaria", "lote", "eytzinger_lote"],
+                        choices=sorted(ALGORITMOS_BENCHMARK))
+    parser.add_argument("--tipo", choices=["int32", "int64", "float32"], default="int64",
+                        help="Tipo de los datos en el arreglo")
+    parser.add_argument("--duracion", type=float, default=0.5, help="Segundos objetivo por medición")
+    parser.add_argument("--semilla", type=int, default=None)
+    parser.add_argument("--formato", choices=["json", "csv"], default="json")
+    parser.add_argument("--salida", default="-", help="Archivo de salida ('-' para stdout)")
+    args = parser.parse_args(argv)
+
+    if not args.benchmark:
+        root = tk.Tk()
+        app = BusquedaApp(root)
+        root.mainloop()
+        return 0
+
+    def progreso(fila):
+        print(f"{fila['algoritmo']}\tn={fila['tamano']}\t{fila['distribucion']}\taciertos={fila['proporcion_aciertos']}\t"
+              f"consultas={fila['consultas']}\t{fila['mediana_ns']:.1f} ns/consulta", file=sys.stderr)
+
+    filas = ejecutar_benchmark(args.tamanos, args.aciertos, args.consultas, args.algoritmos,
+                               duracion_objetivo=args.duracion, semilla=args.semilla, progreso=progreso,
+                               distribuciones=args.distribuciones, tipo=args.tipo)
+    if args.salida == "-":
+        escribir_resultados(filas, sys.stdout, args.formato)
+    else:
+        with open(args.salida, "w", newline="") as f:
+            escribir_resultados(filas, f, args.formato)
+    return 0
+
 # ---------------------------
 # Clase principal de la app
 # ---------------------------
@@ -34,19 +1236,32 @@ class BusquedaApp:
         self.root = root
         self.root.title("Comparación de Búsqueda Lineal y Binaria")
         self.lista = []
+        self.arreglo = np.array([], dtype=np.int64)
 
         # Parámetros
         self.tamanos = [100, 1000, 10000, 100000]
+        self.tamanos_layout = [10**e for e in range(3, 9)]  # 10^3 .. 10^8
 
         # --- Acumuladores de resultados para graficar ---
-        self.resultados_lineal = []   # lista de tuplas (n, tiempo_ms)
-        self.resultados_binaria = []  # lista de tuplas (n, tiempo_ms)
+        # Cada punto es (n, mediana_ms, ic_inf_ms, ic_sup_ms)
+        self.resultados_lineal = []
+        self.resultados_binaria = []
+        self.resultados_lote = []     # tiempos por consulta
+        self.resultados_adaptativa = []
+        self.resultados_layout = {}   # {layout: puntos} del modo de comparación
+        self.hilo_layouts = None      # la comparación de layouts corre fuera del hilo de Tk
+        self.resultados_aprendido = []
+        # Sondeos por búsqueda (n, sondeos) para el eje secundario
+        self.sondeos = {"Binaria": [], "Índice aprendido": []}
+        self.seleccion = None  # (nombre, sondeos promedio) calculada por lista
+        self.filtro = None     # filtro de Bloom de la lista actual
 
         # Widgets
         self.crear_widgets()
 
         # Figura para la gráfica
         self.fig, self.ax = plt.subplots(figsize=(5, 4), dpi=100)
+        self.ax_sondeos = self.ax.twinx()
         self.canvas = FigureCanvasTkAgg(self.fig, master=root)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
 
@@ -63,6 +1278,12 @@ class BusquedaApp:
         # Botón generar datos
         tk.Button(frame_config, text="Generar datos", command=self.generar_datos).grid(row=0, column=2, padx=5)
 
+        # Backend de datos: lista de Python o arreglo tipado contiguo
+        self.combo_backend = ttk.Combobox(frame_config, values=list(BACKENDS_DATOS), state="readonly", width=12)
+        self.combo_backend.set("lista numpy")  # comportamiento original; los tipados son opcionales
+        self.combo_backend.grid(row=0, column=3, padx=5)
+        tk.Button(frame_config, text="Comparar backends", command=self.ejecutar_comparacion_backends).grid(row=0, column=4, padx=5)
+
         # Entrada de valor a buscar
         tk.Label(frame_config, text="Valor a buscar:").grid(row=1, column=0, padx=5)
         self.entry_valor = tk.Entry(frame_config, width=14)
@@ -71,10 +1292,48 @@ class BusquedaApp:
         # Botones de búsqueda
         tk.Button(frame_config, text="Búsqueda lineal", command=self.ejecutar_lineal).grid(row=1, column=2, padx=5)
         tk.Button(frame_config, text="Búsqueda binaria", command=self.ejecutar_binaria).grid(row=1, column=3, padx=5)
+        tk.Button(frame_config, text="Búsqueda adaptativa", command=self.ejecutar_adaptativa).grid(row=1, column=4, padx=5)
+
+        # Modo por lote: N consultas aleatorias en una sola llamada vectorizada
+        tk.Label(frame_config, text="Consultas (lote):").grid(row=3, column=0, padx=5)
+        self.entry_consultas = tk.Entry(frame_config, width=14)
+        self.entry_consultas.insert(0, "100000")
+        self.entry_consultas.grid(row=3, column=1, padx=5)
+        tk.Button(frame_config, text="Búsqueda por lote", command=self.ejecutar_lote).grid(row=3, column=2, padx=5)
+        self.boton_layouts = tk.Button(frame_config, text="Comparar layouts", command=self.ejecutar_comparacion_layouts)
+        self.boton_layouts.grid(row=3, column=3, padx=5)
+
+        # Conteo de ocurrencias / rango [valor, hasta] con límites inferior y superior
+        tk.Label(frame_config, text="Hasta (rango):").grid(row=4, column=0, padx=5)
+        self.entry_hasta = tk.Entry(frame_config, width=14)
+        self.entry_hasta.grid(row=4, column=1, padx=5)
+        tk.Button(frame_config, text="Contar / rango", command=self.ejecutar_conteo).grid(row=4, column=2, padx=5)
+        tk.Button(frame_config, text="Escalamiento paralelo", command=self.ejecutar_escalamiento).grid(row=4, column=3, padx=5)
+        tk.Button(frame_config, text="Índice hash", command=self.ejecutar_indice_hash).grid(row=4, column=4, padx=5)
+        tk.Button(frame_config, text="Índice aprendido", command=self.ejecutar_indice_aprendido).grid(row=5, column=2, padx=5)
+
+        # Filtro de Bloom opcional delante de las búsquedas lineal y binaria
+        self.var_bloom = tk.BooleanVar(value=False)
+        tk.Checkbutton(frame_config, text="Filtro Bloom (tasa FP):", variable=self.var_bloom).grid(row=5, column=0, padx=5)
+        self.entry_fp = tk.Entry(frame_config, width=14)
+        self.entry_fp.insert(0, "0.01")
+        self.entry_fp.grid(row=5, column=1, padx=5)
+
+        # Carga de consultas: distribución y porcentaje de fallos
+        tk.Label(frame_config, text="Carga (fallos %):").grid(row=6, column=0, padx=5)
+        self.combo_carga = ttk.Combobox(frame_config, values=DISTRIBUCIONES_CARGA, state="readonly", width=12)
+        self.combo_carga.set(DISTRIBUCIONES_CARGA[0])
+        self.combo_carga.grid(row=6, column=1, padx=5)
+        self.entry_fallos = tk.Entry(frame_config, width=14)
+        self.entry_fallos.insert(0, "50")
+        self.entry_fallos.grid(row=6, column=2, padx=5)
+        tk.Button(frame_config, text="Reproducir carga", command=self.ejecutar_carga).grid(row=6, column=3, padx=5)
 
         # Botones extra: Reiniciar y Exportar
         tk.Button(frame_config, text="Reiniciar", command=self.reiniciar).grid(row=2, column=2, padx=5, pady=5)
         tk.Button(frame_config, text="Exportar números", command=self.exportar_numeros).grid(row=2, column=3, padx=5, pady=5)
+        tk.Button(frame_config, text="Exportar binario", command=self.exportar_binario).grid(row=2, column=4, padx=5, pady=5)
+        tk.Button(frame_config, text="Abrir binario", command=self.abrir_binario).grid(row=2, column=1, padx=5, pady=5)
 
         # Resultados
         self.label_resultado = tk.Label(self.root, text="Resultado: ")
@@ -86,13 +1345,45 @@ class BusquedaApp:
     def generar_datos(self):
         tam = int(self.combo_size.get())
         # Genera números y ordena (necesario para binaria)
-        self.lista = sorted(np.random.randint(0, 1000, tam))
+        backend = self.combo_backend.get()
+        self.lista, self.arreglo = construir_backend(np.sort(np.random.randint(0, 1000, tam)), backend)
+        self.seleccion = None
+        self.filtro = None
+        self._filtro_actual()
         # Se modificó el tamaño del randint en tu código original por ser demasiados números
         #self.lista = sorted(np.random.randint(0, 1000, tam))
-        self.label_resultado.config(text=f"Lista generada con tamaño {tam}")
+        self.label_resultado.config(
+            text=f"Lista generada con tamaño {tam} (backend {backend}, memoria {memoria_backend(self.lista) / 1024:.1f} KiB)"
+        )
+
+    def _filtro_actual(self):
+        """Filtro de Bloom de la lista actual (se construye una vez) o None si está desactivado."""
+        if not self.var_bloom.get() or len(self.arreglo) == 0:
+            return None
+        try:
+            tasa = float(self.entry_fp.get())
+            if not 0 < tasa < 1:
+                raise ValueError
+        except ValueError:
+            messagebox.showwarning("Error", "La tasa de falsos positivos debe estar entre 0 y 1.")
+            return None
+        if self.filtro is None or self.filtro.tasa_fp != tasa:
+            self.filtro = FiltroBloom.desde_arreglo(self.arreglo, tasa)
+        return self.filtro
+
+    def _texto_bloom(self, algoritmo, valor, ms_sin_filtro):
+        """Mide la misma búsqueda con el filtro delante y describe el resultado."""
+        filtro = self._filtro_actual()
+        if filtro is None:
+            return ""
+        stats = medir_tiempo(busqueda_con_filtro, filtro, algoritmo, self.lista, valor)
+        ms = stats["mediana"] * 1000
+        veredicto = "puede estar" if filtro.contiene(valor) else "descartado"
+        return (f"\n[Bloom] {veredicto}, Tiempo: {ms:.4f} ms ({ms_sin_filtro / ms:.1f}x), "
+                f"Memoria: {filtro.memoria_bytes() / 1024:.1f} KiB, k={filtro.k}, FP objetivo {filtro.tasa_fp}")
 
     def ejecutar_lineal(self):
-        if not self.lista:
+        if len(self.lista) == 0:
             messagebox.showwarning("Error", "Primero genera la lista.")
             return
         try:
@@ -101,25 +1392,27 @@ class BusquedaApp:
             messagebox.showwarning("Error", "Introduce un valor válido.")
             return
 
-        inicio = time.perf_counter()
-        indice = busqueda_lineal(self.lista, valor)
-        fin = time.perf_counter()
-        ms = (fin - inicio) * 1000
+        # Sobre arreglos (p. ej. columnas mapeadas desde disco) se recorre por bloques
+        algoritmo = busqueda_lineal_por_bloques if isinstance(self.lista, np.ndarray) else busqueda_lineal
+        indice = algoritmo(self.lista, valor)
+        stats = medir_tiempo(algoritmo, self.lista, valor)
+        ms = stats["mediana"] * 1000
 
-        # Guardar punto para la gráfica
-        self.resultados_lineal.append((len(self.lista), ms))
+        # Guardar punto para la gráfica (mediana e IC en ms)
+        self.resultados_lineal.append((len(self.lista), ms, stats["ic_inf"] * 1000, stats["ic_sup"] * 1000))
+        texto_bloom = self._texto_bloom(algoritmo, valor, ms)
 
         if indice != -1:
             self.label_resultado.config(
-                text=f"[Lineal] Tamaño: {len(self.lista)}, Valor {valor} encontrado en índice {indice}, Tiempo: {ms:.4f} ms"
+                text=f"[Lineal] Tamaño: {len(self.lista)}, Valor {valor} encontrado en índice {indice}, Tiempo: {ms:.4f} ms (IQR {stats['iqr'] * 1000:.4f} ms, {stats['muestras']} muestras)" + texto_bloom
             )
         else:
             self.label_resultado.config(
-                text=f"[Lineal] Tamaño: {len(self.lista)}, Valor {valor} no encontrado, Tiempo: {ms:.4f} ms"
+                text=f"[Lineal] Tamaño: {len(self.lista)}, Valor {valor} no encontrado, Tiempo: {ms:.4f} ms (IQR {stats['iqr'] * 1000:.4f} ms, {stats['muestras']} muestras)" + texto_bloom
             )
 
     def ejecutar_binaria(self):
-        if not self.lista:
+        if len(self.lista) == 0:
             messagebox.showwarning("Error", "Primero genera la lista.")
             return
         try:
@@ -128,32 +1421,335 @@ class BusquedaApp:
             messagebox.showwarning("Error", "Introduce un valor válido.")
             return
 
-        inicio = time.perf_counter()
         indice = busqueda_binaria(self.lista, valor)
-        fin = time.perf_counter()
-        ms = (fin - inicio) * 1000
+        stats = medir_tiempo(busqueda_binaria, self.lista, valor)
+        ms = stats["mediana"] * 1000
 
-        # Guardar punto para la gráfica
-        self.resultados_binaria.append((len(self.lista), ms))
+        # Guardar punto para la gráfica (mediana e IC en ms)
+        self.resultados_binaria.append((len(self.lista), ms, stats["ic_inf"] * 1000, stats["ic_sup"] * 1000))
+        texto_bloom = self._texto_bloom(busqueda_binaria, valor, ms)
 
         if indice != -1:
             self.label_resultado.config(
-                text=f"[Binaria] Tamaño: {len(self.lista)}, Valor {valor} encontrado en índice {indice}, Tiempo: {ms:.4f} ms"
+                text=f"[Binaria] Tamaño: {len(self.lista)}, Valor {valor} encontrado en índice {indice}, Tiempo: {ms:.4f} ms (IQR {stats['iqr'] * 1000:.4f} ms, {stats['muestras']} muestras)" + texto_bloom
             )
         else:
             self.label_resultado.config(
-                text=f"[Binaria] Tamaño: {len(self.lista)}, Valor {valor} no encontrado, Tiempo: {ms:.4f} ms"
+                text=f"[Binaria] Tamaño: {len(self.lista)}, Valor {valor} no encontrado, Tiempo: {ms:.4f} ms (IQR {stats['iqr'] * 1000:.4f} ms, {stats['muestras']} muestras)" + texto_bloom
             )
 
+    def ejecutar_adaptativa(self):
+        if len(self.lista) == 0:
+            messagebox.showwarning("Error", "Primero genera la lista.")
+            return
+        try:
+            valor = int(self.entry_valor.get())
+        except ValueError:
+            messagebox.showwarning("Error", "Introduce un valor válido.")
+            return
+
+        # El selector se evalúa una vez por lista generada
+        if self.seleccion is None:
+            self.seleccion = seleccionar_busqueda(self.lista)
+        nombre, promedios = self.seleccion
+        algoritmo = BUSQUEDAS_ORDENADAS[nombre]
+
+        indice, sondeos = contar_sondeos(algoritmo, self.lista, valor)
+        stats = medir_tiempo(algoritmo, self.lista, valor)
+        ms = stats["mediana"] * 1000
+
+        self.resultados_adaptativa.append((len(self.lista), ms, stats["ic_inf"] * 1000, stats["ic_sup"] * 1000))
+
+        resumen = ", ".join(f"{k}: {v:.1f}" for k, v in promedios.items())
+        estado = f"encontrado en índice {indice}" if indice != -1 else "no encontrado"
+        self.label_resultado.config(
+            text=f"[Adaptativa → {nombre}] Tamaño: {len(self.lista)}, Valor {valor} {estado}, "
+                 f"Sondeos: {sondeos}, Tiempo: {ms:.4f} ms\nSondeos promedio ({resumen})"
+        )
+
+    def ejecutar_conteo(self):
+        """Cuenta ocurrencias del valor, o elementos en [valor, hasta] si se da el límite."""
+        if len(self.lista) == 0:
+            messagebox.showwarning("Error", "Primero genera la lista.")
+            return
+        try:
+            a = int(self.entry_valor.get())
+            texto_hasta = self.entry_hasta.get().strip()
+            b = int(texto_hasta) if texto_hasta else a
+        except ValueError:
+            messagebox.showwarning("Error", "Introduce valores válidos.")
+            return
+        if b < a:
+            a, b = b, a
+
+        inicio_t = time.perf_counter()
+        inicio = limite_inferior(self.arreglo, a)
+        fin = limite_superior(self.arreglo, b)
+        ms = (time.perf_counter() - inicio_t) * 1000
+
+        cantidad = max(0, fin - inicio)
+        if a == b:
+            texto = f"[Conteo] Valor {a} aparece {cantidad} veces (índices {inicio}..{fin - 1})"
+        else:
+            texto = f"[Rango] {cantidad} elementos en [{a}, {b}] (índices {inicio}..{fin - 1})"
+        self.label_resultado.config(text=f"{texto}, Tiempo: {ms:.4f} ms")
+
+    def ejecutar_escalamiento(self):
+        """Búsqueda lineal paralela con 1, 2, 4 y 8 procesos: aceleración y eficiencia."""
+        if len(self.lista) == 0:
+            messagebox.showwarning("Error", "Primero genera la lista.")
+            return
+        try:
+            valor = int(self.entry_valor.get())
+        except ValueError:
+            messagebox.showwarning("Error", "Introduce un valor válido.")
+            return
+
+        self.label_resultado.config(text="Midiendo escalamiento paralelo...")
+        self.root.update_idletasks()
+        filas = escalamiento_busqueda_paralela(self.arreglo, valor)
+        lineas = [f"P={p}: {t * 1000:.4f} ms, aceleración {a:.2f}x, eficiencia {e * 100:.0f}%"
+                  for p, t, a, e in filas]
+        self.label_resultado.config(
+            text=f"[Paralela] Tamaño: {len(self.arreglo)}, Valor {valor}\n" + "\n".join(lineas)
+        )
+
+    def ejecutar_indice_hash(self):
+        """Construye un índice hash sobre los datos y muestra cuándo compensa su construcción."""
+        if len(self.lista) == 0:
+            messagebox.showwarning("Error", "Primero genera la lista.")
+            return
+        try:
+            n_consultas = int(self.entry_consultas.get())
+            if n_consultas <= 0:
+                raise ValueError
+        except ValueError:
+            messagebox.showwarning("Error", "Introduce un número de consultas válido.")
+            return
+
+        consultas = np.random.randint(0, 1000, n_consultas).astype(np.int64)
+        costo = costo_indice_hash(self.arreglo, consultas)
+
+        def veces(q, unidad="consultas"):
+            return "nunca" if math.isinf(q) else f"{math.ceil(q)} {unidad}"
+
+        self.label_resultado.config(
+            text=f"[Índice hash] Tamaño: {len(self.arreglo)}, Memoria: {costo['memoria_bytes'] / 1024:.1f} KiB, "
+                 f"Construcción: {costo['construccion'] * 1000:.4f} ms\n"
+                 f"Por consulta: hash {costo['consulta_hash'] * 1e6:.3f} µs, binaria {costo['consulta_binaria'] * 1e6:.3f} µs, "
+                 f"lineal {costo['consulta_lineal'] * 1e6:.3f} µs\n"
+                 f"Compensa frente a lineal desde {veces(costo['punto_equilibrio_lineal'])}; "
+                 f"frente a ordenar + binaria desde {veces(costo['punto_equilibrio_binaria'])}\n"
+                 f"Por actualización: hash {costo['actualizacion_hash'] * 1e6:.3f} µs, "
+                 f"reordenar {costo['reordenar'] * 1e6:.3f} µs; con datos que cambian compensa desde "
+                 f"{veces(costo['punto_equilibrio_actualizaciones'], 'actualizaciones')}"
+        )
+
+    def ejecutar_indice_aprendido(self):
+        """Construye el índice aprendido y lo compara con la búsqueda binaria (tiempo y sondeos)."""
+        if len(self.lista) == 0:
+            messagebox.showwarning("Error", "Primero genera la lista.")
+            return
+        try:
+            valor = int(self.entry_valor.get())
+        except ValueError:
+            messagebox.showwarning("Error", "Introduce un valor válido.")
+            return
+
+        inicio = time.perf_counter()
+        indice_aprendido = IndiceAprendido(self.arreglo)
+        ms_construccion = (time.perf_counter() - inicio) * 1000
+
+        indice = indice_aprendido.buscar(valor)
+        stats = medir_tiempo(indice_aprendido.buscar, valor)
+        ms = stats["mediana"] * 1000
+        n = len(self.arreglo)
+        self.resultados_aprendido.append((n, ms, stats["ic_inf"] * 1000, stats["ic_sup"] * 1000))
+
+        sondeos_aprendido = indice_aprendido.sondeos(valor)
+        _, sondeos_binaria = contar_sondeos(busqueda_binaria, self.arreglo, valor)
+        self.sondeos["Índice aprendido"].append((n, sondeos_aprendido))
+        self.sondeos["Binaria"].append((n, sondeos_binaria))
+
+        estado = f"encontrado en índice {indice}" if indice != -1 else "no encontrado"
+        self.label_resultado.config(
+            text=f"[Índice aprendido] Tamaño: {n}, Valor {valor} {estado}, Tiempo: {ms:.4f} ms\n"
+                 f"Tramos: {len(indice_aprendido.claves_inicio)}, Tamaño del índice: {indice_aprendido.memoria_bytes() / 1024:.1f} KiB, "
+                 f"Construcción: {ms_construccion:.4f} ms, Sondeos: {sondeos_aprendido} (binaria: {sondeos_binaria})"
+        )
+        self.actualizar_grafica()
+
+    def ejecutar_carga(self):
+        """Reproduce un flujo de consultas en cada algoritmo: throughput y latencias p50/p99."""
+        if len(self.lista) == 0:
+            messagebox.showwarning("Error", "Primero genera la lista.")
+            return
+        try:
+            n_consultas = int(self.entry_consultas.get())
+            fallos = float(self.entry_fallos.get()) / 100
+            if n_consultas <= 0 or not 0 <= fallos <= 1:
+                raise ValueError
+        except ValueError:
+            messagebox.showwarning("Error", "Introduce consultas (> 0) y fallos (0-100) válidos.")
+            return
+
+        distribucion = self.combo_carga.get()
+        consultas = generar_carga(self.arreglo, n_consultas, distribucion, fallos).tolist()
+        lista = self.lista
+        buscadores = {nombre: (lambda v, f=f: f(lista, v)) for nombre, f in BUSQUEDAS_ORDENADAS.items()}
+        # La lineal es O(n) por consulta: se limita a ~2·10^7 comparaciones en total
+        n_lineal = max(1, min(n_consultas, 2 * 10**7 // len(lista)))
+        resultados = reproducir_carga(buscadores, consultas)
+        lineal = busqueda_lineal_por_bloques if isinstance(lista, np.ndarray) else busqueda_lineal
+        resultados["Lineal"] = reproducir_carga({"Lineal": lambda v: lineal(lista, v)}, consultas[:n_lineal])["Lineal"]
+
+        lineas = [f"{nombre}: {r['consultas_por_seg']:,.0f} consultas/s, p50 {r['p50_ns'] / 1000:.2f} µs, "
+                  f"p99 {r['p99_ns'] / 1000:.2f} µs" for nombre, r in resultados.items()]
+        nota = f" (lineal con {n_lineal} consultas)" if n_lineal < n_consultas else ""
+        self.label_resultado.config(
+            text=f"[Carga {distribucion}, {fallos * 100:.0f}% fallos] Tamaño: {len(lista)}, "
+                 f"Consultas: {n_consultas}{nota}\n" + "\n".join(lineas)
+        )
+
+    def ejecutar_comparacion_backends(self):
+        """Memoria y tiempo de búsqueda binaria de los mismos datos en cada backend."""
+        if len(self.lista) == 0:
+            messagebox.showwarning("Error", "Primero genera la lista.")
+            return
+        valores = np.random.randint(0, 1000, 1000).tolist()
+        resultados = comparar_backends(np.asarray(self.arreglo), valores)
+        lineas = [f"{backend}: {r['memoria_bytes'] / 1024:.1f} KiB, binaria {r['binaria_s'] * 1e6:.3f} µs/consulta"
+                  for backend, r in resultados.items()]
+        self.label_resultado.config(
+            text=f"[Backends] Tamaño: {len(self.arreglo)}\n" + "\n".join(lineas)
+        )
+
+    def ejecutar_lote(self):
+        if len(self.lista) == 0:
+            messagebox.showwarning("Error", "Primero genera la lista.")
+            return
+        try:
+            n_consultas = int(self.entry_consultas.get())
+            if n_consultas <= 0:
+                raise ValueError
+        except ValueError:
+            messagebox.showwarning("Error", "Introduce un número de consultas válido.")
+            return
+
+        # Consultas en el mismo rango que los datos (incluye aciertos y fallos)
+        consultas = np.random.randint(0, 1000, n_consultas).astype(np.int64)
+
+        indices = busqueda_binaria_lote(self.arreglo, consultas)
+        stats = medir_tiempo(busqueda_binaria_lote, self.arreglo, consultas)
+        ms_total = stats["mediana"] * 1000
+        ms_por_consulta = ms_total / n_consultas
+
+        # Guardar punto para la gráfica (latencia amortizada)
+        self.resultados_lote.append((len(self.arreglo), ms_por_consulta,
+                                     stats["ic_inf"] * 1000 / n_consultas,
+                                     stats["ic_sup"] * 1000 / n_consultas))
+
+        encontrados = int(np.count_nonzero(indices != -1))
+        self.label_resultado.config(
+            text=f"[Lote] Tamaño: {len(self.arreglo)}, Consultas: {n_consultas}, Encontrados: {encontrados}, "
+                 f"Tiempo total: {ms_total:.4f} ms, Por consulta: {ms_por_consulta * 1000:.4f} µs"
+        )
+
+    def ejecutar_comparacion_layouts(self):
+        """Modo benchmark: layout ordenado clásico vs Eytzinger de 10^3 a 10^8 elementos.
+
+        La medición corre en un hilo aparte para que la ventana siga
+        respondiendo, y se omiten los tamaños que no caben en la memoria
+        disponible.
+        """
+        if self.hilo_layouts is not None and self.hilo_layouts.is_alive():
+            return
+        try:
+            n_consultas = int(self.entry_consultas.get())
+            if n_consultas <= 0:
+                raise ValueError
+        except ValueError:
+            messagebox.showwarning("Error", "Introduce un número de consultas válido.")
+            return
+
+        self.label_resultado.config(text="Comparando layouts... (puede tardar en tamaños grandes)")
+        self.boton_layouts.config(state=tk.DISABLED)
+        salida = {}
+        tamanos, memoria = list(self.tamanos_layout), memoria_disponible()
+
+        def medir():
+            try:
+                salida["resultados"] = comparar_layouts(tamanos, n_consultas=n_consultas, memoria_max=memoria)
+            except Exception as e:
+                salida["error"] = e
+
+        self.hilo_layouts = threading.Thread(target=medir, daemon=True)
+        self.hilo_layouts.start()
+        self.root.after(100, self._terminar_comparacion_layouts, salida, tamanos)
+
+    def _terminar_comparacion_layouts(self, salida, tamanos):
+        # Tk no es seguro entre hilos: la ventana solo se toca desde aquí, en el hilo principal
+        if self.hilo_layouts.is_alive():
+            self.root.after(100, self._terminar_comparacion_layouts, salida, tamanos)
+            return
+        self.boton_layouts.config(state=tk.NORMAL)
+        if "error" in salida:
+            self.label_resultado.config(text="")
+            messagebox.showerror("Error", f"No se pudo comparar los layouts:\n{salida['error']}")
+            return
+
+        self.resultados_layout = salida["resultados"]
+        medidos = self.resultados_layout["Clásico"]
+        if not medidos:
+            self.label_resultado.config(text="")
+            messagebox.showwarning("Error", "No hubo memoria suficiente para ningún tamaño.")
+            return
+
+        n_max, ms_clasico = medidos[-1][0], medidos[-1][1]
+        ms_eytz = self.resultados_layout["Eytzinger"][-1][1]
+        omitidos = ""
+        if len(medidos) < len(tamanos):
+            omitidos = f"; desde n={tamanos[len(medidos)]} no cabe en memoria"
+        self.label_resultado.config(
+            text=f"[Layouts] Hasta n={n_max}: Clásico {ms_clasico * 1e6:.1f} ns/consulta, "
+                 f"Eytzinger {ms_eytz * 1e6:.1f} ns/consulta{omitidos}"
+        )
+        self.actualizar_grafica()
+
     def actualizar_grafica(self):
         self.ax.clear()
 
-        if self.resultados_lineal:
-            xs_l, ys_l = zip(*self.resultados_lineal)
-            self.ax.plot(xs_l, ys_l, 'o-', label="Búsqueda Lineal")
-        if self.resultados_binaria:
-            xs_b, ys_b = zip(*self.resultados_binaria)
-            self.ax.plot(xs_b, ys_b, 'o-', label="Búsqueda Binaria")
+        series = [
+            (self.resultados_lineal, "Búsqueda Lineal"),
+            (self.resultados_binaria, "Búsqueda Binaria"),
+            (self.resultados_lote, "Binaria por lote (por consulta)"),
+            (self.resultados_adaptativa, "Búsqueda Adaptativa"),
+            (self.resultados_aprendido, "Índice Aprendido"),
+        ]
+        series += [(puntos, f"Layout {nombre} (por consulta)") for nombre, puntos in self.resultados_layout.items()]
+        for resultados, etiqueta in series:
+            if resultados:
+                # Ordenar por n para que la línea no zigzaguee
+                xs, ys, ic_inf, ic_sup = zip(*sorted(resultados))
+                yerr = [
+                    [y - lo for y, lo in zip(ys, ic_inf)],
+                    [hi - y for y, hi in zip(ys, ic_sup)],
+                ]
+                self.ax.errorbar(xs, ys, yerr=yerr, fmt='o-', capsize=3, label=etiqueta)
+
+        # Eje secundario: sondeos por búsqueda (líneas discontinuas)
+        self.ax_sondeos.clear()
+        # clear() devuelve las marcas a la izquierda; el eje secundario va a la derecha
+        self.ax_sondeos.yaxis.tick_right()
+        self.ax_sondeos.yaxis.set_label_position("right")
+        hay_sondeos = False
+        for etiqueta, puntos in self.sondeos.items():
+            if puntos:
+                xs, ys = zip(*sorted(puntos))
+                self.ax_sondeos.plot(xs, ys, 's--', alpha=0.6, label=f"Sondeos {etiqueta}")
+                hay_sondeos = True
+        self.ax_sondeos.set_ylabel("Sondeos por búsqueda" if hay_sondeos else "")
+        self.ax_sondeos.set_visible(hay_sondeos)
 
         self.ax.set_title("Comparación de tiempos (ms) vs tamaño")
         self.ax.set_xlabel("Tamaño de la lista (n)")
@@ -162,7 +1758,11 @@ class BusquedaApp:
         # ---- cambio clave: semilogaritmica ----
         self.ax.set_xscale("log")
 
-        self.ax.legend()
+        lineas, etiquetas = self.ax.get_legend_handles_labels()
+        if hay_sondeos:
+            lineas_s, etiquetas_s = self.ax_sondeos.get_legend_handles_labels()
+            lineas, etiquetas = lineas + lineas_s, etiquetas + etiquetas_s
+        self.ax.legend(lineas, etiquetas)
         self.ax.grid(True, which="both", ls=":")
 
         self.canvas.draw()
@@ -170,9 +1770,19 @@ class BusquedaApp:
     def reiniciar(self):
         """Limpia lista, resultados y gráfica."""
         self.lista = []
+        self.arreglo = np.array([], dtype=np.int64)
         self.resultados_lineal.clear()
         self.resultados_binaria.clear()
+        self.resultados_lote.clear()
+        self.resultados_adaptativa.clear()
+        self.resultados_layout = {}
+        self.resultados_aprendido.clear()
+        for puntos in self.sondeos.values():
+            puntos.clear()
+        self.filtro = None
+        self.seleccion = None
         self.entry_valor.delete(0, tk.END)
+        self.entry_hasta.delete(0, tk.END)
         self.label_resultado.config(text="Resultado: ")
         # Limpia la gráfica
         self.ax.clear()
@@ -180,12 +1790,14 @@ class BusquedaApp:
         self.ax.set_xlabel("Tamaño de la lista (n)")
         self.ax.set_ylabel("Tiempo (ms)")
         self.ax.grid(True)
+        self.ax_sondeos.clear()
+        self.ax_sondeos.set_visible(False)
         self.canvas.draw()
         messagebox.showinfo("Reiniciar", "Se limpió la lista y los resultados.")
 
     def exportar_numeros(self):
         """Exporta los números generados a un CSV (uno por línea)."""
-        if not self.lista:
+        if len(self.lista) == 0:
             messagebox.showwarning("Exportar", "No hay números que exportar. Genera la lista primero.")
             return
 
@@ -200,15 +1812,56 @@ class BusquedaApp:
 
         try:
             # Guardar uno por línea (columna única)
-            np.savetxt(ruta, np.array(self.lista, dtype=int), fmt="%d", delimiter=",")
+            np.savetxt(ruta, np.asarray(self.arreglo, dtype=int), fmt="%d", delimiter=",")
             messagebox.showinfo("Exportar", f"Números exportados a:\n{ruta}")
         except Exception as e:
             messagebox.showerror("Error", f"No se pudo exportar el archivo:\n{e}")
 
+    def exportar_binario(self):
+        """Exporta la lista ordenada al formato binario de columna (para memoria mapeada)."""
+        if len(self.lista) == 0:
+            messagebox.showwarning("Exportar", "No hay números que exportar. Genera la lista primero.")
+            return
+
+        ruta = filedialog.asksaveasfilename(
+            defaultextension=".bsq",
+            filetypes=[("Columna ordenada", "*.bsq"), ("Todos", "*.*")],
+            initialfile=f"numeros_{len(self.arreglo)}.bsq",
+            title="Guardar columna binaria"
+        )
+        if not ruta:
+            return  # usuario canceló
+
+        try:
+            guardar_columna_ordenada(ruta, self.arreglo)
+            messagebox.showinfo("Exportar", f"Columna binaria exportada a:\n{ruta}")
+        except Exception as e:
+            messagebox.showerror("Error", f"No se pudo exportar el archivo:\n{e}")
+
+    def abrir_binario(self):
+        """Abre una columna binaria con memoria mapeada; las búsquedas trabajan directo sobre el disco."""
+        ruta = filedialog.askopenfilename(
+            filetypes=[("Columna ordenada", "*.bsq"), ("Todos", "*.*")],
+            title="Abrir columna binaria"
+        )
+        if not ruta:
+            return  # usuario canceló
+
+        try:
+            self.arreglo = abrir_columna_ordenada(ruta)
+        except Exception as e:
+            messagebox.showerror("Error", f"No se pudo abrir el archivo:\n{e}")
+            return
+        # No se convierte a lista: eso cargaría todo el archivo en memoria
+        self.lista = self.arreglo
+        self.seleccion = None
+        self.filtro = None
+        self.label_resultado.config(
+            text=f"Columna mapeada con tamaño {len(self.arreglo)} ({self.arreglo.dtype}) desde {ruta}"
+        )
+
 # ---------------------------
 # Ejecutar la app
 # ---------------------------
 if __name__ == "__main__":
-    root = tk.Tk()
-    app = BusquedaApp(root)
-    root.mainloop()
+    sys.exit(main())
@@ -0,0 +1,315 @@
+"""Pruebas de las búsquedas, índices y utilidades de lineal&binaria.py.
+
+El nombre del script no es un módulo importable, así que se carga con
+importlib. Se ejecutan con `python -m pytest` desde esta carpeta o la raíz.
+"""
+import bisect
+import importlib.util
+import io
+import json
+import os
+import pathlib
+import sys
+
+import numpy as np
+import pytest
+
+os.environ.setdefault("MPLBACKEND", "Agg")
+_RUTA = pathlib.Path(__file__).with_name("lineal&binaria.py")
+_spec = importlib.util.spec_from_file_location("lineal_binaria", _RUTA)
+lb = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = lb  # como un import normal: pickle busca las funciones por nombre
+_spec.loader.exec_module(lb)
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng(1234)
+
+
+def _ordenado(rng, n, alto=None):
+    """Arreglo ordenado con duplicados (valores en [0, alto))."""
+    return np.sort(rng.integers(0, alto or max(2 * n, 1), n))
+
+
+def _consultas(rng, arreglo, k=300):
+    """Mitad presentes y mitad al azar (muchas ausentes), más los bordes."""
+    presentes = arreglo[rng.integers(0, len(arreglo), k // 2)] if len(arreglo) else np.array([], dtype=np.int64)
+    azar = rng.integers(-5, (int(arreglo[-1]) if len(arreglo) else 10) + 5, k // 2)
+    return np.concatenate([presentes, azar, [-10**6, 10**6]]).astype(np.int64)
+
+
+def _comprobar_indice(arreglo, valor, indice):
+    """Un índice válido apunta al valor; -1 solo si el valor no está."""
+    if indice == -1:
+        assert valor not in set(arreglo.tolist())
+    else:
+        assert arreglo[indice] == valor
+
+
+# ---------------------------
+# Búsquedas escalares y por lote
+# ---------------------------
+@pytest.mark.parametrize("n", [0, 1, 2, 7, 100, 1000])
+def test_busqueda_binaria_y_lineal(rng, n):
+    arreglo = _ordenado(rng, n)
+    lista = arreglo.tolist()
+    for v in _consultas(rng, arreglo).tolist():
+        _comprobar_indice(arreglo, v, lb.busqueda_binaria(lista, v))
+        assert lb.busqueda_lineal(lista, v) == (lista.index(v) if v in lista else -1)
+
+
+def test_busqueda_binaria_lote_coincide_con_escalar(rng):
+    arreglo = _ordenado(rng, 2000)
+    consultas = _consultas(rng, arreglo)
+    resultado = lb.busqueda_binaria_lote(arreglo, consultas)
+    assert resultado.dtype == np.int64
+    for v, i in zip(consultas.tolist(), resultado.tolist()):
+        _comprobar_indice(arreglo, v, i)
+        if i != -1:
+            assert i == bisect.bisect_left(arreglo.tolist(), v)
+
+
+@pytest.mark.parametrize("n", [0, 1, 2, 7, 100, 1000])
+@pytest.mark.parametrize("algoritmo", [lb.busqueda_interpolacion, lb.busqueda_exponencial, lb.busqueda_galope])
+def test_busquedas_adaptativas(rng, n, algoritmo):
+    arreglo = _ordenado(rng, n)
+    lista = arreglo.tolist()
+    for v in _consultas(rng, arreglo).tolist():
+        _comprobar_indice(arreglo, v, algoritmo(lista, v))
+
+
+def test_galope_con_inicio_explicito(rng):
+    arreglo = _ordenado(rng, 500)
+    lista = arreglo.tolist()
+    for inicio in (0, 250, 499):
+        for v in _consultas(rng, arreglo, 50).tolist():
+            _comprobar_indice(arreglo, v, lb.busqueda_galope(lista, v, inicio))
+
+
+def test_contar_sondeos_y_selector():
+    lista = np.arange(0, 20000, 2).tolist()
+    indice, sondeos = lb.contar_sondeos(lb.busqueda_binaria, lista, 5000)
+    assert lista[indice] == 5000 and 1 <= sondeos <= 2 * 14  # hasta dos lecturas por nivel
+    # En datos uniformes la interpolación necesita menos sondeos que la binaria
+    _, uniforme = lb.contar_sondeos(lb.busqueda_interpolacion, lista, 5000)
+    assert uniforme < sondeos
+    nombre, promedios = lb.seleccionar_busqueda(lista, semilla=0)
+    assert nombre in lb.BUSQUEDAS_ORDENADAS and set(promedios) == set(lb.BUSQUEDAS_ORDENADAS)
+    assert lb.seleccionar_busqueda([]) == ("Binaria", {})
+
+
+def test_limites_y_conteos(rng):
+    arreglo = _ordenado(rng, 1000, alto=100)
+    lista = arreglo.tolist()
+    consultas = _consultas(rng, arreglo)
+    for v in consultas.tolist():
+        assert lb.limite_inferior(lista, v) == bisect.bisect_left(lista, v)
+        assert lb.limite_superior(lista, v) == bisect.bisect_right(lista, v)
+    esperado = [lista.count(v) for v in consultas.tolist()]
+    assert lb.contar_ocurrencias_lote(arreglo, consultas).tolist() == esperado
+
+    inicio, fin = lb.rango_entre(arreglo, 20, 30)
+    assert all(20 <= x <= 30 for x in lista[inicio:fin])
+    assert fin - inicio == sum(20 <= x <= 30 for x in lista)
+    a = rng.integers(0, 100, 50)
+    b = a + rng.integers(-5, 20, 50)
+    assert lb.contar_rango_lote(arreglo, a, b).tolist() == [
+        sum(x <= y <= z for y in lista) for x, z in zip(a.tolist(), b.tolist())]
+
+
+# ---------------------------
+# Backends de datos
+# ---------------------------
+@pytest.mark.parametrize("backend", list(lb.BACKENDS_DATOS))
+def test_backends_misma_respuesta(rng, backend):
+    arreglo = _ordenado(rng, 500)
+    secuencia, tipado = lb.construir_backend(arreglo, backend)
+    assert len(secuencia) == len(arreglo)
+    assert lb.memoria_backend(secuencia) > 0
+    for v in _consultas(rng, arreglo, 50).tolist():
+        _comprobar_indice(arreglo, v, lb.busqueda_binaria(secuencia, v))
+
+
+def test_backend_desconocido():
+    with pytest.raises(ValueError):
+        lb.construir_backend(np.arange(5), "int8")
+
+
+# ---------------------------
+# Índices
+# ---------------------------
+@pytest.mark.parametrize("tam_segmento", [1, 4, 256])
+def test_indice_aprendido(rng, tam_segmento):
+    arreglo = _ordenado(rng, 3000, alto=500)  # muchos duplicados cruzando tramos
+    indice = lb.IndiceAprendido(arreglo, tam_segmento=tam_segmento)
+    consultas = _consultas(rng, arreglo)
+    lote = indice.buscar_lote(consultas)
+    lista = arreglo.tolist()
+    for v, i in zip(consultas.tolist(), lote.tolist()):
+        esperado = bisect.bisect_left(lista, v)
+        esperado = esperado if esperado < len(lista) and lista[esperado] == v else -1
+        assert i == esperado
+        assert indice.buscar(v) == esperado
+
+
+def test_indice_hash_contra_dict(rng):
+    arreglo = rng.integers(-1000, 1000, 2000)
+    indice = lb.IndiceHash.desde_arreglo(arreglo)
+    referencia = {}
+    for i, v in enumerate(arreglo.tolist()):
+        referencia.setdefault(v, i)
+    consultas = rng.integers(-1200, 1200, 500)
+    assert indice.buscar_lote(consultas).tolist() == [referencia.get(v, -1) for v in consultas.tolist()]
+
+    # Inserciones, reemplazos y borrados mezclados (con tombstones y redimensionado)
+    for paso in range(3000):
+        clave = int(rng.integers(-300, 300))
+        if rng.random() < 0.4:
+            assert indice.eliminar(clave) == (clave in referencia)
+            referencia.pop(clave, None)
+        else:
+            indice.insertar(clave, paso)
+            referencia[clave] = paso
+    assert len(indice) == len(referencia)
+    for clave in range(-1200, 1200):
+        assert indice.buscar(clave) == referencia.get(clave, -1)
+        assert (clave in indice) == (clave in referencia)
+
+
+def test_indice_hash_se_construye_sin_ordenar(rng, monkeypatch):
+    arreglo = rng.integers(0, 50, 5000)  # casi todo duplicados
+    for nombre in ("sort", "argsort", "unique"):
+        monkeypatch.setattr(np, nombre, lambda *a, **k: pytest.fail("la construcción no debe ordenar"))
+    indice = lb.IndiceHash.desde_arreglo(arreglo)
+    monkeypatch.undo()
+    assert len(indice) == len(set(arreglo.tolist()))
+    assert [indice.buscar(v) for v in range(50)] == [arreglo.tolist().index(v) for v in range(50)]
+    assert len(lb.IndiceHash.desde_arreglo(np.array([], dtype=np.int64))) == 0
+
+
+def test_costo_indice_hash_incluye_actualizaciones(rng):
+    costo = lb.costo_indice_hash(np.arange(20000), rng.integers(0, 20000, 500), duracion_objetivo=0.01)
+    assert costo["actualizacion_hash"] > 0 and costo["reordenar"] > 0
+    assert costo["punto_equilibrio_actualizaciones"] >= 0
+    assert costo["punto_equilibrio_lineal"] >= 0 and costo["punto_equilibrio_binaria"] >= 0
+
+
+def test_filtro_bloom_sin_falsos_negativos(rng):
+    datos = rng.integers(0, 10**9, 5000)
+    filtro = lb.FiltroBloom.desde_arreglo(datos, tasa_fp=0.01)
+    assert filtro.contiene_lote(datos).all()
+    assert all(filtro.contiene(v) for v in datos[:500].tolist())
+
+    ausentes = rng.integers(10**9, 2 * 10**9, 20000)
+    lote = filtro.contiene_lote(ausentes)
+    assert lote.tolist() == [filtro.contiene(v) for v in ausentes.tolist()]
+    assert lote.mean() < 0.03
+
+    lista = np.sort(datos).tolist()
+    assert lb.busqueda_con_filtro(filtro, lb.busqueda_binaria, lista, -1) == -1
+
+
+# ---------------------------
+# Columnas en disco
+# ---------------------------
+def test_columna_ordenada_ida_y_vuelta(tmp_path, rng):
+    datos = _ordenado(rng, 10000).astype(np.int32)
+    ruta = tmp_path / "columna.bsq"
+    lb.guardar_columna_ordenada(ruta, datos, tam_bloque=999)
+    columna = lb.abrir_columna_ordenada(ruta)
+    assert columna.dtype == np.int32
+    assert np.array_equal(columna, datos)
+    v = int(datos[1234])
+    assert lb.busqueda_lineal_por_bloques(columna, v, tam_bloque=100) == datos.tolist().index(v)
+    assert lb.busqueda_lineal_por_bloques(columna, -1, tam_bloque=100) == -1
+    del columna
+
+
+def test_columna_rechaza_desordenados_y_archivos_ajenos(tmp_path):
+    with pytest.raises(ValueError):
+        lb.guardar_columna_ordenada(tmp_path / "x.bsq", np.array([1, 3, 2]))
+    with pytest.raises(ValueError):  # desorden justo en la frontera entre bloques
+        lb.guardar_columna_ordenada(tmp_path / "x.bsq", np.array([1, 5, 4, 6]), tam_bloque=2)
+    ajeno = tmp_path / "ajeno.bin"
+    ajeno.write_bytes(b"\0" * 100)
+    with pytest.raises(ValueError):
+        lb.abrir_columna_ordenada(ajeno)
+
+
+# ---------------------------
+# Layout de Eytzinger
+# ---------------------------
+def test_eytzinger(rng):
+    for n in (0, 1, 2, 3, 15, 16, 17, 1000):
+        arreglo = np.unique(_ordenado(rng, n))
+        eytz, posiciones = lb.construir_eytzinger(arreglo)
+        consultas = _consultas(rng, arreglo, 100) if len(arreglo) else np.array([1, 2])
+        lote = lb.busqueda_eytzinger_lote(eytz, posiciones, consultas)
+        for v, i in zip(consultas.tolist(), lote.tolist()):
+            _comprobar_indice(arreglo, v, i)
+            assert lb.busqueda_eytzinger(eytz, posiciones, v) == i
+
+
+def test_comparar_layouts_respeta_memoria_max():
+    memoria = 10**4 * lb.BYTES_POR_ELEMENTO_LAYOUT
+    resultados = lb.comparar_layouts([1000, 10**4, 10**9], n_consultas=100, duracion_objetivo=0.01,
+                                     semilla=0, memoria_max=memoria)
+    for puntos in resultados.values():
+        assert [n for n, *_ in puntos] == [1000, 10**4]  # 10^9 no se intenta
+    disponible = lb.memoria_disponible()
+    assert disponible is None or disponible > 0
+
+
+# ---------------------------
+# Búsqueda lineal paralela
+# ---------------------------
+def test_buscador_lineal_paralelo_primer_indice(rng):
+    datos = rng.integers(0, 50, 20000)
+    lista = datos.tolist()
+    with lb.BuscadorLinealParalelo(datos, procesos=2, tam_bloque=1000) as buscador:
+        for v in (0, 7, 49, 50, -1):
+            assert buscador.buscar(v) == lb.busqueda_lineal(lista, v)
+
+
+# ---------------------------
+# Medición
+# ---------------------------
+def test_medir_tiempo_estadisticos():
+    stats = lb.medir_tiempo(sum, range(100), calentamiento=1, duracion_objetivo=0.01, min_muestras=5)
+    assert stats["muestras"] >= 5
+    assert stats["q1"] <= stats["mediana"] <= stats["q3"]
+    assert stats["ic_inf"] <= stats["mediana"] <= stats["ic_sup"]
+
+
+@pytest.mark.parametrize("distribucion", lb.DISTRIBUCIONES_CARGA)
+def test_generar_carga_respeta_fallos(distribucion):
+    arreglo = np.arange(0, 20000, 2)
+    rng = np.random.default_rng(7)
+    consultas = lb.generar_carga(arreglo, 5000, distribucion, proporcion_fallos=0.3, rng=rng)
+    assert len(consultas) == 5000
+    presentes = np.isin(consultas, arreglo)
+    assert abs((1 - presentes.mean()) - 0.3) < 0.05
+    if distribucion == "secuencial":
+        aciertos = consultas[presentes]
+        assert np.all(np.diff(aciertos) >= 0)
+
+
+def test_ejecutar_benchmark_y_escritura():
+    filas = lb.ejecutar_benchmark([1000], [0.0, 1.0], [200], sorted(lb.ALGORITMOS_BENCHMARK),
+                                  duracion_objetivo=0.001, semilla=3)
+    assert len(filas) == 2 * len(lb.ALGORITMOS_BENCHMARK)
+    assert all(f["mediana_ns"] > 0 for f in filas)
+
+    salida = io.StringIO()
+    lb.escribir_resultados(filas, salida, "json")
+    assert len(json.loads(salida.getvalue())["resultados"]) == len(filas)
+    salida = io.StringIO()
+    lb.escribir_resultados(filas, salida, "csv")
+    assert len(salida.getvalue().strip().splitlines()) == len(filas) + 1
+
+
+def test_benchmark_omite_listas_grandes():
+    filas = lb.ejecutar_benchmark([2000], [1.0], [100], ["binaria", "lote"],
+                                  duracion_objetivo=0.001, semilla=0, max_n_lista=1000)
+    assert [f["algoritmo"] for f in filas] == ["lote"]
@@ -1,32 +1,143 @@
 import tkinter as tk
 import random
 import time
+import math
+import tracemalloc
+import argparse
+import os
+import heapq
+import itertools
+import tempfile
+import atexit
+import json
+import csv
+import hashlib
+import inspect
+import platform
+import datetime
+import multiprocessing as mp
+from multiprocessing import shared_memory, resource_tracker
+from multiprocessing.connection import wait
+from collections import deque
+import numpy as np
 import matplotlib.pyplot as plt
 
  #Generador de listas aleatorias
 
-def Generador(N):
-    """Genera una lista de N números enteros aleatorios."""
-    return [random.randint(50, 10000) for _ in range(N)]
+def Generador(N, distintos=None):
+    """Genera una lista de N números enteros aleatorios.
+
+    Con `distintos` los valores se eligen entre solo esa cantidad de claves
+    del rango [50, 10000], para controlar cuántos duplicados hay.
+    """
+    if distintos is None:
+        return [random.randint(50, 10000) for _ in range(N)]
+    if distintos < 1:
+        raise ValueError("distintos debe ser al menos 1")
+    claves = random.sample(range(50, 10001), min(distintos, 10000 - 50 + 1))
+    return [random.choice(claves) for _ in range(N)]
+
+# Generadores de entradas estructuradas (con semilla, para repetir exactamente el mismo caso)
+
+def _entrada_aleatoria(N, rng):
+    return [rng.randint(50, 10000) for _ in range(N)]
+
+
+def _entrada_casi_ordenada(N, rng, intercambios=None):
+    """Ordenada y luego k intercambios al azar (por defecto k = N/100)."""
+    lista = sorted(_entrada_aleatoria(N, rng))
+    if N < 2:
+        return lista
+    for _ in range(max(1, N // 100) if intercambios is None else intercambios):
+        i, j = rng.randrange(N), rng.randrange(N)
+        lista[i], lista[j] = lista[j], lista[i]
+    return lista
+
+
+def _entrada_organo(N, rng):
+    """Tubos de órgano: sube hasta la mitad y vuelve a bajar."""
+    lista = sorted(_entrada_aleatoria(N, rng))
+    return lista[::2] + lista[1::2][::-1]
+
+
+def _entrada_sierra(N, rng):
+    """Diente de sierra: ~sqrt(N) tramos ascendentes seguidos."""
+    periodo = max(1, math.isqrt(N))
+    lista = _entrada_aleatoria(N, rng)
+    return [x for k in range(0, N, periodo) for x in sorted(lista[k:k + periodo])]
+
+
+def _entrada_pocas_claves(N, rng, distintos=10):
+    claves = rng.sample(range(50, 10001), distintos)
+    return [rng.choice(claves) for _ in range(N)]
+
+
+DISTRIBUCIONES_ENTRADA = {
+    "aleatoria": _entrada_aleatoria,
+    "ordenada": lambda N, rng: sorted(_entrada_aleatoria(N, rng)),
+    "invertida": lambda N, rng: sorted(_entrada_aleatoria(N, rng), reverse=True),
+    "casi_ordenada": _entrada_casi_ordenada,
+    "organo": _entrada_organo,
+    "sierra": _entrada_sierra,
+    "pocas_claves": _entrada_pocas_claves,
+}
+DIRECTORIO_DATOS = "datos_entrada"
+
+
+def GenerarEntrada(N, distribucion="aleatoria", semilla=0, directorio=DIRECTORIO_DATOS):
+    """Lista de N enteros en [50, 10000] con la forma `distribucion` y la semilla dada.
+
+    Con `directorio` la lista se guarda como .npy la primera vez y en las
+    siguientes ejecuciones se lee de disco, así que todas usan exactamente
+    los mismos datos sin regenerarlos. El nombre del archivo lleva un hash
+    del código del generador, así que si este cambia se genera de nuevo.
+    Con directorio=None no se usa caché.
+    """
+    if distribucion not in DISTRIBUCIONES_ENTRADA:
+        raise ValueError(f"Distribución no soportada: {distribucion}")
+    ruta = None
+    if directorio:
+        # Todas las distribuciones parten de _entrada_aleatoria
+        codigo = inspect.getsource(DISTRIBUCIONES_ENTRADA[distribucion]) + inspect.getsource(_entrada_aleatoria)
+        huella = hashlib.sha256(codigo.encode()).hexdigest()[:12]
+        ruta = os.path.join(directorio, f"{distribucion}_N{N}_s{semilla}_{huella}.npy")
+        if os.path.exists(ruta):
+            return np.load(ruta).tolist()
+    lista = DISTRIBUCIONES_ENTRADA[distribucion](N, random.Random(semilla))
+    if ruta:
+        os.makedirs(directorio, exist_ok=True)
+        np.save(ruta, np.asarray(lista, dtype=np.int64))
+    return lista
+
 
 # Algoritmos de ordenamiento
 
-def bubble_sort(arr):
+# bubble_sort, merge_sort y quick_sort aceptan un `contador` opcional
+# (ver ContarOperaciones). Sin él solo se paga una comprobación por llamada
+# recursiva o por intercambio; las comparaciones las cuentan los elementos.
+
+def bubble_sort(arr, contador=None):
     arr = arr.copy()
     n = len(arr)
+    if contador is not None:
+        contador.asignaciones += 1
+        contador.escrituras += n
     for i in range(n):
         for j in range(0, n - i - 1):
             if arr[j] > arr[j + 1]:
                 arr[j], arr[j + 1] = arr[j + 1], arr[j]
+                if contador is not None:
+                    contador.intercambios += 1
+                    contador.escrituras += 2
     return arr
 
 
-def merge_sort(arr):
+def merge_sort(arr, contador=None):
     arr = arr.copy()
     if len(arr) > 1:
         mid = len(arr) // 2
-        L = merge_sort(arr[:mid])
-        R = merge_sort(arr[mid:])
+        L = merge_sort(arr[:mid], contador)
+        R = merge_sort(arr[mid:], contador)
 
         merged = []
         i = j = 0
@@ -39,25 +150,510 @@ def merge_sort(arr):
                 j += 1
         merged.extend(L[i:])
         merged.extend(R[j:])
+        if contador is not None:
+            # Copia, dos mitades, merged y dos colas; cada elemento se escribe
+            # en la copia, en su mitad y en merged, y los de las colas una vez más
+            contador.asignaciones += 6
+            contador.escrituras += 3 * len(arr) + (len(L) - i) + (len(R) - j)
         return merged
     else:
+        if contador is not None:
+            contador.asignaciones += 1
+            contador.escrituras += len(arr)
         return arr
 
 
-def quick_sort(arr):
+def _fusionar(origen, destino, inicio, medio, fin):
+    """Mezcla origen[inicio:medio] y origen[medio:fin] en destino[inicio:fin] (estable)."""
+    i, j, k = inicio, medio, inicio
+    while i < medio and j < fin:
+        if origen[j] < origen[i]:
+            destino[k] = origen[j]
+            j += 1
+        else:
+            destino[k] = origen[i]
+            i += 1
+        k += 1
+    while i < medio:
+        destino[k] = origen[i]
+        i += 1
+        k += 1
+    while j < fin:
+        destino[k] = origen[j]
+        j += 1
+        k += 1
+
+
+def merge_sort_bottom_up(arr, natural=False):
+    """Merge sort iterativo con un único buffer auxiliar.
+
+    Se reservan solo dos listas (la copia de la entrada y el buffer) y cada
+    pasada mezcla de una a la otra, alternando sus papeles. Con
+    natural=True se parte de las secuencias ascendentes que ya tiene la
+    entrada en lugar de tramos de tamaño 1, así una lista casi ordenada
+    necesita muy pocas pasadas.
+    """
+    origen = arr.copy()
+    n = len(origen)
+    if n < 2:
+        return origen
+    destino = [None] * n
+
+    if not natural:
+        ancho = 1
+        while ancho < n:
+            for inicio in range(0, n, 2 * ancho):
+                medio = min(inicio + ancho, n)
+                fin = min(inicio + 2 * ancho, n)
+                _fusionar(origen, destino, inicio, medio, fin)
+            origen, destino = destino, origen
+            ancho *= 2
+        return origen
+
+    # Natural: límites de las secuencias ascendentes existentes
+    limites = [0]
+    for i in range(1, n):
+        if origen[i] < origen[i - 1]:
+            limites.append(i)
+    limites.append(n)
+    while len(limites) > 2:
+        nuevos = [0]
+        for r in range(0, len(limites) - 1, 2):
+            inicio, medio = limites[r], limites[r + 1]
+            fin = limites[r + 2] if r + 2 < len(limites) else medio
+            _fusionar(origen, destino, inicio, medio, fin)
+            nuevos.append(fin)
+        limites = nuevos
+        origen, destino = destino, origen
+    return origen
+
+
+def quick_sort(arr, contador=None):
     arr = arr.copy()
     if len(arr) <= 1:
+        if contador is not None:
+            contador.asignaciones += 1
+            contador.escrituras += len(arr)
         return arr
     else:
         pivot = arr[0]
         menores = [x for x in arr[1:] if x <= pivot]
         mayores = [x for x in arr[1:] if x > pivot]
-        return quick_sort(menores) + [pivot] + quick_sort(mayores)
+        if contador is not None:
+            # Copia, dos slices arr[1:], dos comprensiones, [pivot] y dos concatenaciones
+            n = len(arr)
+            contador.asignaciones += 8
+            contador.escrituras += n + 2 * (n - 1) + len(menores) + len(mayores) + 1 + (len(menores) + 1) + n
+        return quick_sort(menores, contador) + [pivot] + quick_sort(mayores, contador)
+
+def _insercion(arr, inicio, fin):
+    """Ordena por inserción arr[inicio:fin + 1] en el lugar."""
+    for i in range(inicio + 1, fin + 1):
+        x = arr[i]
+        j = i - 1
+        while j >= inicio and arr[j] > x:
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = x
+
+
+def _heap_sort(arr, inicio, fin):
+    """Heapsort en el lugar sobre arr[inicio:fin + 1] (respaldo O(n log n) del introsort)."""
+    n = fin - inicio + 1
+
+    def hundir(raiz, limite):
+        while True:
+            hijo = 2 * raiz + 1
+            if hijo >= limite:
+                return
+            if hijo + 1 < limite and arr[inicio + hijo + 1] > arr[inicio + hijo]:
+                hijo += 1
+            if arr[inicio + raiz] >= arr[inicio + hijo]:
+                return
+            arr[inicio + raiz], arr[inicio + hijo] = arr[inicio + hijo], arr[inicio + raiz]
+            raiz = hijo
+
+    for raiz in range(n // 2 - 1, -1, -1):
+        hundir(raiz, n)
+    for ultimo in range(n - 1, 0, -1):
+        arr[inicio], arr[inicio + ultimo] = arr[inicio + ultimo], arr[inicio]
+        hundir(0, ultimo)
+
+
+def intro_sort(arr, umbral_insercion=16):
+    """Quicksort en el lugar con mediana de tres, respaldo heapsort e inserción.
+
+    Copia la entrada una sola vez. Si la recursión pasa de 2·log2(n) niveles
+    se cambia a heapsort, así el peor caso queda en O(n log n). Se recurre
+    sobre la partición menor y se itera sobre la mayor, de modo que la pila
+    nunca pasa de O(log n) aunque la entrada ya esté ordenada.
+    """
+    arr = arr.copy()
+    if len(arr) > 1:
+        _intro_sort(arr, 0, len(arr) - 1, 2 * int(math.log2(len(arr))), umbral_insercion)
+    return arr
+
+
+def _intro_sort(arr, inicio, fin, profundidad, umbral_insercion):
+    while fin - inicio + 1 > umbral_insercion:
+        if profundidad == 0:
+            _heap_sort(arr, inicio, fin)
+            return
+        profundidad -= 1
+
+        # Mediana de tres: deja arr[inicio] <= arr[medio] <= arr[fin]
+        medio = (inicio + fin) // 2
+        if arr[medio] < arr[inicio]:
+            arr[medio], arr[inicio] = arr[inicio], arr[medio]
+        if arr[fin] < arr[inicio]:
+            arr[fin], arr[inicio] = arr[inicio], arr[fin]
+        if arr[fin] < arr[medio]:
+            arr[fin], arr[medio] = arr[medio], arr[fin]
+        pivot = arr[medio]
+
+        # Partición de Hoare
+        i, j = inicio - 1, fin + 1
+        while True:
+            i += 1
+            while arr[i] < pivot:
+                i += 1
+            j -= 1
+            while arr[j] > pivot:
+                j -= 1
+            if i >= j:
+                break
+            arr[i], arr[j] = arr[j], arr[i]
+
+        # Recursión sobre la parte menor, iteración sobre la mayor
+        if j - inicio < fin - j:
+            _intro_sort(arr, inicio, j, profundidad, umbral_insercion)
+            inicio = j + 1
+        else:
+            _intro_sort(arr, j + 1, fin, profundidad, umbral_insercion)
+            fin = j
+    _insercion(arr, inicio, fin)
+
+def quick_sort_3way(arr):
+    """Quicksort en el lugar con partición de tres vías (bandera holandesa).
+
+    Separa < pivote, == pivote y > pivote; las claves iguales al pivote
+    quedan en su sitio y no se vuelven a tocar, así que con muchos
+    duplicados el costo baja hacia O(n·k) para k claves distintas.
+    """
+    arr = arr.copy()
+    _quick_sort_3way(arr, 0, len(arr) - 1)
+    return arr
+
+
+def _quick_sort_3way(arr, inicio, fin):
+    while inicio < fin:
+        # Pivote: mediana de tres valores
+        a, b, c = arr[inicio], arr[(inicio + fin) // 2], arr[fin]
+        pivot = max(min(a, b), min(max(a, b), c))
+
+        menor, i, mayor = inicio, inicio, fin
+        while i <= mayor:
+            if arr[i] < pivot:
+                arr[menor], arr[i] = arr[i], arr[menor]
+                menor += 1
+                i += 1
+            elif arr[i] > pivot:
+                arr[i], arr[mayor] = arr[mayor], arr[i]
+                mayor -= 1
+            else:
+                i += 1
+
+        # Recursión sobre la parte menor, iteración sobre la mayor
+        if menor - inicio < fin - mayor:
+            _quick_sort_3way(arr, inicio, menor - 1)
+            inicio = mayor + 1
+        else:
+            _quick_sort_3way(arr, mayor + 1, fin)
+            fin = menor - 1
+
+# Merge sort paralelo (procesos + memoria compartida + mezcla de k vías)
+
+def _ordenar_trozo(nombre_shm, n, inicio, fin):
+    """Trabajador: ordena con merge_sort su trozo del arreglo compartido y lo escribe en el sitio."""
+    shm = shared_memory.SharedMemory(name=nombre_shm)
+    try:
+        datos = np.ndarray((n,), dtype=np.int64, buffer=shm.buf)
+        datos[inicio:fin] = merge_sort(datos[inicio:fin].tolist())
+        del datos
+    finally:
+        shm.close()
+
+
+def _mezcla_k_vias(trozos):
+    """Mezcla k listas ordenadas con un montículo de (valor, trozo, posición)."""
+    salida = []
+    monticulo = [(trozo[0], t, 0) for t, trozo in enumerate(trozos) if trozo]
+    heapq.heapify(monticulo)
+    while monticulo:
+        valor, t, i = monticulo[0]
+        salida.append(valor)
+        if i + 1 < len(trozos[t]):
+            heapq.heapreplace(monticulo, (trozos[t][i + 1], t, i + 1))
+        else:
+            heapq.heappop(monticulo)
+    return salida
+
+
+def merge_sort_paralelo(arr, procesos=None, pool=None):
+    """Divide en P trozos, los ordena en un pool de procesos y los mezcla con un montículo.
+
+    Los datos viajan por memoria compartida (solo enteros que quepan en
+    int64): a los trabajadores solo se les envía el nombre del bloque y sus
+    límites. Si no se pasa `pool` se crea uno para esta llamada.
+    """
+    procesos = procesos or os.cpu_count() or 1
+    n = len(arr)
+    if n < 2 or procesos == 1:
+        return merge_sort(arr)
+
+    shm = shared_memory.SharedMemory(create=True, size=n * 8)
+    try:
+        datos = np.ndarray((n,), dtype=np.int64, buffer=shm.buf)
+        datos[:] = arr
+        limites = [n * p // procesos for p in range(procesos + 1)]
+        tareas = [(shm.name, n, limites[p], limites[p + 1]) for p in range(procesos)]
+        if pool is None:
+            with mp.Pool(procesos) as propio:
+                propio.starmap(_ordenar_trozo, tareas)
+        else:
+            pool.starmap(_ordenar_trozo, tareas)
+        trozos = [datos[limites[p]:limites[p + 1]].tolist() for p in range(procesos)]
+        del datos
+    finally:
+        shm.close()
+        shm.unlink()
+    return _mezcla_k_vias(trozos)
+
+# Ordenamiento externo (datos más grandes que la memoria)
+
+def _leer_trozos(ruta, formato, tam_trozo, io):
+    """Lee el archivo de entrada en trozos de como mucho `tam_trozo` enteros."""
+    if formato == "binario":
+        with open(ruta, "rb") as f:
+            while True:
+                trozo = np.fromfile(f, dtype=np.int64, count=tam_trozo)
+                if trozo.size == 0:
+                    return
+                io["leidos"] += trozo.nbytes
+                yield trozo
+    else:
+        with open(ruta) as f:
+            while True:
+                lineas = list(itertools.islice(f, tam_trozo))
+                if not lineas:
+                    return
+                io["leidos"] += sum(len(l) for l in lineas)
+                yield np.array([int(l) for l in lineas if l.strip()], dtype=np.int64)
+
+
+def _leer_corrida(ruta, tam_bloque, io):
+    """Recorre una corrida binaria bloque a bloque (memoria acotada por tam_bloque)."""
+    with open(ruta, "rb") as f:
+        while True:
+            bloque = np.fromfile(f, dtype=np.int64, count=tam_bloque)
+            if bloque.size == 0:
+                return
+            io["leidos"] += bloque.nbytes
+            yield from bloque.tolist()
+
+
+def _escribir_bloque(f, bloque, formato, io):
+    if formato == "binario":
+        datos = np.asarray(bloque, dtype=np.int64)
+        datos.tofile(f)
+        io["escritos"] += datos.nbytes
+    else:
+        texto = "\n".join(map(str, bloque)) + "\n"
+        f.write(texto)
+        io["escritos"] += len(texto)
+
+
+def _mezclar_corridas(rutas, destino, tam_bloque, formato, io):
+    """Mezcla de k vías en streaming: un bloque por corrida + un bloque de salida en memoria."""
+    with open(destino, "wb" if formato == "binario" else "w") as f:
+        bloque = []
+        for valor in heapq.merge(*[_leer_corrida(r, tam_bloque, io) for r in rutas]):
+            bloque.append(valor)
+            if len(bloque) >= tam_bloque:
+                _escribir_bloque(f, bloque, formato, io)
+                bloque = []
+        if bloque:
+            _escribir_bloque(f, bloque, formato, io)
+
+
+def ordenamiento_externo(entrada, salida, tam_trozo=1_000_000, fan_in=16, tam_bloque=65536,
+                         formato_entrada="texto", formato_salida="binario", directorio_temporal=None):
+    """Ordena un archivo de enteros con memoria acotada.
+
+    Fase 1: lee trozos de `tam_trozo` enteros, los ordena y los vuelca como
+    corridas binarias (int64) en archivos temporales. Fase 2: mezcla las
+    corridas de `fan_in` en `fan_in` con un montículo, leyendo y escribiendo
+    en bloques de `tam_bloque`, hasta que queda una sola, que se escribe en
+    `salida`. La memoria máxima es ~max(tam_trozo, (fan_in + 1)·tam_bloque)
+    enteros, independiente del tamaño del archivo.
+
+    Formatos: "texto" (un entero por línea) o "binario" (int64 crudo).
+    Devuelve un reporte con el tiempo y el volumen de E/S de cada fase.
+    """
+    if fan_in < 2:
+        raise ValueError("fan_in debe ser al menos 2")
+    fases = []
+    elementos = 0
+    with tempfile.TemporaryDirectory(dir=directorio_temporal) as temporal:
+        # Fase 1: corridas ordenadas
+        io = {"leidos": 0, "escritos": 0}
+        inicio = time.perf_counter()
+        corridas = []
+        for i, trozo in enumerate(_leer_trozos(entrada, formato_entrada, tam_trozo, io)):
+            trozo.sort()
+            ruta = os.path.join(temporal, f"corrida_0_{i}.bin")
+            with open(ruta, "wb") as f:
+                _escribir_bloque(f, trozo, "binario", io)
+            corridas.append(ruta)
+            elementos += trozo.size
+        fases.append({"fase": "corridas", "segundos": time.perf_counter() - inicio,
+                      "bytes_leidos": io["leidos"], "bytes_escritos": io["escritos"],
+                      "corridas": len(corridas)})
+
+        # Fase 2: pasadas de mezcla de k vías
+        pasada = 0
+        while True:
+            pasada += 1
+            io = {"leidos": 0, "escritos": 0}
+            inicio = time.perf_counter()
+            if len(corridas) <= fan_in:
+                _mezclar_corridas(corridas, salida, tam_bloque, formato_salida, io)
+                corridas_resultado = 1
+            else:
+                nuevas = []
+                for g in range(0, len(corridas), fan_in):
+                    ruta = os.path.join(temporal, f"corrida_{pasada}_{g // fan_in}.bin")
+                    _mezclar_corridas(corridas[g:g + fan_in], ruta, tam_bloque, "binario", io)
+                    nuevas.append(ruta)
+                corridas_resultado = len(nuevas)
+            for ruta in corridas:
+                os.remove(ruta)
+            fases.append({"fase": f"mezcla {pasada}", "segundos": time.perf_counter() - inicio,
+                          "bytes_leidos": io["leidos"], "bytes_escritos": io["escritos"],
+                          "corridas": corridas_resultado})
+            if corridas_resultado == 1:
+                break
+            corridas = nuevas
+
+    return {
+        "elementos": elementos,
+        "fases": fases,
+        "segundos": sum(f["segundos"] for f in fases),
+        "bytes_leidos": sum(f["bytes_leidos"] for f in fases),
+        "bytes_escritos": sum(f["bytes_escritos"] for f in fases),
+    }
+
+
+def GenerarArchivo(ruta, N, formato="texto", tam_bloque=1_000_000):
+    """Escribe N enteros aleatorios del mismo rango que Generador, por bloques (sirve para varios GB)."""
+    io = {"leidos": 0, "escritos": 0}
+    with open(ruta, "wb" if formato == "binario" else "w") as f:
+        for inicio in range(0, N, tam_bloque):
+            bloque = np.random.randint(50, 10001, min(tam_bloque, N - inicio))
+            _escribir_bloque(f, bloque if formato == "binario" else bloque.tolist(), formato, io)
+    return io["escritos"]
+
+# Ordenamientos lineales (claves enteras acotadas, como las de Generador)
+
+def counting_sort(arr):
+    """Counting sort: cuenta cada clave entre el mínimo y el máximo. O(n + k)."""
+    if not arr:
+        return []
+    minimo, maximo = min(arr), max(arr)
+    conteo = [0] * (maximo - minimo + 1)
+    for x in arr:
+        conteo[x - minimo] += 1
+    salida = []
+    for i, c in enumerate(conteo):
+        if c:
+            salida.extend([i + minimo] * c)
+    return salida
+
+
+def radix_sort(arr, bits=8):
+    """Radix sort LSD con cubetas de 2^bits; O(n·d) con d = dígitos de la clave mayor."""
+    if not arr:
+        return []
+    minimo = min(arr)
+    datos = [x - minimo for x in arr]
+    maximo = max(datos)
+    mascara = (1 << bits) - 1
+    desplazamiento = 0
+    while maximo >> desplazamiento:
+        cubetas = [[] for _ in range(1 << bits)]
+        for x in datos:
+            cubetas[(x >> desplazamiento) & mascara].append(x)
+        datos = [x for cubeta in cubetas for x in cubeta]
+        desplazamiento += bits
+    return [x + minimo for x in datos]
+
+
+def counting_sort_numpy(arr):
+    """Counting sort vectorizado con np.bincount + np.repeat."""
+    a = np.asarray(arr, dtype=np.int64)
+    if a.size == 0:
+        return []
+    minimo = a.min()
+    conteo = np.bincount(a - minimo)
+    return np.repeat(np.arange(len(conteo), dtype=np.int64) + minimo, conteo).tolist()
+
+
+def radix_sort_numpy(arr, bits=8):
+    """Radix sort LSD vectorizado: cada pasada reordena por un dígito de forma estable.
+
+    El argsort estable de NumPy sobre enteros de 8/16 bits es a su vez un
+    radix sort, así que cada pasada es O(n); por eso `bits` va de 1 a 16.
+    """
+    if not 1 <= bits <= 16:
+        raise ValueError("bits debe estar entre 1 y 16 (los dígitos se guardan en uint8/uint16)")
+    a = np.asarray(arr, dtype=np.int64)
+    if a.size == 0:
+        return []
+    minimo = a.min()
+    datos = (a - minimo).astype(np.uint64)
+    maximo = int(datos.max())
+    tipo_digito = np.uint8 if bits <= 8 else np.uint16
+    mascara = np.uint64((1 << bits) - 1)
+    desplazamiento = 0
+    while maximo >> desplazamiento:
+        digito = ((datos >> np.uint64(desplazamiento)) & mascara).astype(tipo_digito)
+        datos = datos[np.argsort(digito, kind="stable")]
+        desplazamiento += bits
+    return (datos.astype(np.int64) + minimo).tolist()
 
 # Ordenador
 
+# Algoritmos que lanzan sus propios procesos: no pueden correr dentro de
+# los procesos (daemon) del barrido paralelo, que no admiten hijos
+ALGORITMOS_CON_PROCESOS = {"MergePar"}
+_pool_merge_paralelo = None
+
+
+def _pool_compartido():
+    """Pool reutilizado por Ordenador("MergePar"); se crea una vez y fuera del tiempo medido."""
+    global _pool_merge_paralelo
+    if _pool_merge_paralelo is None and (os.cpu_count() or 1) > 1:
+        # Los trabajadores deben heredar el rastreador de recursos del padre; si
+        # arrancan antes que él, cada uno crea el suyo y avisa de fugas al salir
+        resource_tracker.ensure_running()
+        _pool_merge_paralelo = mp.Pool(os.cpu_count())
+        atexit.register(_pool_merge_paralelo.terminate)
+    return _pool_merge_paralelo
+
+
 def Ordenador(lista, algoritmo):
     """Ordena la lista usando el algoritmo seleccionado."""
+    pool = _pool_compartido() if algoritmo == "MergePar" else None
     inicio = time.perf_counter()
 
     if algoritmo == "Bubble":
@@ -66,6 +662,27 @@ def Ordenador(lista, algoritmo):
         Ordenada = merge_sort(lista)
     elif algoritmo == "Quick":
         Ordenada = quick_sort(lista)
+    elif algoritmo == "Intro":
+        Ordenada = intro_sort(lista)
+    elif algoritmo == "MergeBU":
+        Ordenada = merge_sort_bottom_up(lista)
+    elif algoritmo == "Natural":
+        Ordenada = merge_sort_bottom_up(lista, natural=True)
+    elif algoritmo == "Quick3":
+        Ordenada = quick_sort_3way(lista)
+    elif algoritmo == "Counting":
+        Ordenada = counting_sort(lista)
+    elif algoritmo == "Radix":
+        Ordenada = radix_sort(lista)
+    elif algoritmo == "CountingNP":
+        Ordenada = counting_sort_numpy(lista)
+    elif algoritmo == "RadixNP":
+        Ordenada = radix_sort_numpy(lista)
+    elif algoritmo == "MergePar":
+        Ordenada = merge_sort_paralelo(lista, pool=pool)
+    elif algoritmo == "NumPy":
+        # Referencia O(n log n) en C (incluye la conversión de ida y vuelta)
+        Ordenada = np.sort(np.asarray(lista)).tolist()
     else:
         raise ValueError("Algoritmo no soportado")
 
@@ -73,42 +690,873 @@ def Ordenador(lista, algoritmo):
     return fin - inicio, Ordenada
 
 
+# Todos los nombres que acepta Ordenador
+ALGORITMOS = ["Bubble", "Merge", "Quick", "Intro", "MergeBU", "Natural", "Quick3", "Counting", "Radix",
+              "CountingNP", "RadixNP", "MergePar", "NumPy"]
+
+
+def MedirMemoria(lista, algoritmo):
+    """Pico de memoria (bytes) reservado al ordenar, medido con tracemalloc.
+
+    Se mide en una ejecución aparte de la de Ordenador porque tracemalloc
+    hace mucho más lentas las reservas y falsearía los tiempos. tracemalloc
+    solo conoce la memoria viva y su pico, no cuántas reservas hubo: las
+    listas nuevas las da ContarOperaciones, y solo para ALGORITMOS_CONTADOS.
+    """
+    tracemalloc.start()
+    try:
+        Ordenador(lista, algoritmo)
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return pico
+
+
+# Caché persistente de resultados
+
+# Funciones cuyo código fuente define cada algoritmo (la entrada y sus
+# auxiliares): si cambia alguna, sus mediciones guardadas dejan de valer
+FUNCIONES_ALGORITMO = {
+    "Bubble": [bubble_sort],
+    "Merge": [merge_sort],
+    "Quick": [quick_sort],
+    "Intro": [intro_sort, _intro_sort, _insercion, _heap_sort],
+    "MergeBU": [merge_sort_bottom_up, _fusionar],
+    "Natural": [merge_sort_bottom_up, _fusionar],
+    "Quick3": [quick_sort_3way, _quick_sort_3way],
+    "Counting": [counting_sort],
+    "Radix": [radix_sort],
+    "CountingNP": [counting_sort_numpy],
+    "RadixNP": [radix_sort_numpy],
+    "MergePar": [merge_sort_paralelo, _ordenar_trozo, _mezcla_k_vias, merge_sort],
+    "NumPy": [],
+}
+RUTA_CACHE = "resultados_cache.jsonl"
+
+
+def _codigo_campo(campo):
+    """Código que produce cada campo guardado, además del propio algoritmo."""
+    return {
+        "tiempo": [Ordenador],
+        "memoria": [Ordenador, MedirMemoria],
+        "conteo": [ContarOperaciones, Contador, _Contado],
+    }[campo]
+
+
+def huella_algoritmo(algoritmo, campo="tiempo"):
+    """Hash SHA-256 (16 hex) del código del algoritmo, del que produce `campo` y la versión de NumPy."""
+    h = hashlib.sha256(f"{algoritmo}|{campo}|numpy {np.__version__}".encode())
+    for funcion in FUNCIONES_ALGORITMO[algoritmo] + _codigo_campo(campo):
+        h.update(inspect.getsource(funcion).encode())
+    return h.hexdigest()[:16]
+
+
+class CacheResultados:
+    """Historial de mediciones en un archivo JSON Lines, con una línea por medición.
+
+    La clave de cada medición es (algoritmo, huella del código, generador,
+    semilla, N, versión de Python). Al consultar se usa la última medición
+    con esa clave, así que un algoritmo modificado, otra entrada u otro
+    intérprete se vuelven a medir solos. La huella incluye Ordenador; la
+    memoria y los conteos guardan además la huella de MedirMemoria y de
+    ContarOperaciones. Invalidar añade una marca en vez
+    de borrar, para que el historial completo siga disponible. Las
+    mediciones que agotaron el presupuesto del barrido paralelo se guardan
+    como descartes con la misma clave, para no relanzarlas mientras el
+    código no cambie.
+    """
+
+    def __init__(self, ruta=RUTA_CACHE):
+        self.ruta = ruta
+        self.registros = []
+        self.vigentes = {}
+        self.descartes = {}   # clave -> presupuesto (seg) que agotó
+        self._huellas = {}
+        if os.path.exists(ruta):
+            with open(ruta, encoding="utf-8") as f:
+                for linea in f:
+                    if linea.strip():
+                        self._incorporar(json.loads(linea))
+
+    def _incorporar(self, registro):
+        if registro.get("invalidar"):
+            algoritmos = registro["invalidar"]
+            for vigentes in (self.vigentes, self.descartes):
+                for clave in [c for c in vigentes if algoritmos == "*" or c[0] in algoritmos]:
+                    del vigentes[clave]
+        elif "descartado" in registro:
+            self.descartes[self._clave_registro(registro)] = registro["descartado"]
+        else:
+            self.registros.append(registro)
+            self.vigentes[self._clave_registro(registro)] = registro
+            self.descartes.pop(self._clave_registro(registro), None)
+
+    def _agregar(self, registro):
+        with open(self.ruta, "a", encoding="utf-8") as f:
+            f.write(json.dumps(registro, ensure_ascii=False) + "\n")
+        self._incorporar(registro)
+
+    @staticmethod
+    def _clave_registro(r):
+        return (r["algoritmo"], r["huella"], r["generador"], r["semilla"], r["n"], r["python"])
+
+    def clave(self, algoritmo, n, semilla, generador="aleatoria"):
+        """Clave de la medición, o None si el algoritmo no tiene código conocido."""
+        if algoritmo not in FUNCIONES_ALGORITMO:
+            return None
+        return (algoritmo, self._huella(algoritmo, "tiempo"), generador, semilla, n, platform.python_version())
+
+    def _huella(self, algoritmo, campo):
+        if (algoritmo, campo) not in self._huellas:
+            self._huellas[(algoritmo, campo)] = huella_algoritmo(algoritmo, campo)
+        return self._huellas[(algoritmo, campo)]
+
+    def obtener(self, algoritmo, n, semilla, generador="aleatoria", memoria=False, conteo=False):
+        """Medición vigente, o None si falta o si la memoria/los conteos pedidos faltan o son de otro código."""
+        registro = self.vigentes.get(self.clave(algoritmo, n, semilla, generador))
+        if registro is None:
+            return None
+        huellas = registro.get("huellas", {})
+        if memoria and (registro["memoria"] is None or huellas.get("memoria") != self._huella(algoritmo, "memoria")):
+            return None
+        if conteo and algoritmo in ALGORITMOS_CONTADOS and (
+                registro["conteo"] is None or huellas.get("conteo") != self._huella(algoritmo, "conteo")):
+            return None
+        return registro
+
+    def guardar(self, algoritmo, n, semilla, tiempo, memoria=None, conteo=None, generador="aleatoria"):
+        clave = self.clave(algoritmo, n, semilla, generador)
+        if clave is None:
+            return
+        # La memoria y los conteos llevan su propia huella: la del código que los produjo
+        huellas = {campo: self._huella(algoritmo, campo)
+                   for campo, valor in (("memoria", memoria), ("conteo", conteo)) if valor is not None}
+        self._agregar({"algoritmo": algoritmo, "huella": clave[1], "huellas": huellas, "generador": generador,
+                       "semilla": semilla, "n": n, "python": clave[5],
+                       "fecha": datetime.datetime.now().isoformat(timespec="seconds"),
+                       "tiempo": tiempo, "memoria": memoria, "conteo": conteo})
+
+    def descartar(self, algoritmo, n, semilla, presupuesto, generador="aleatoria"):
+        """Anota que (algoritmo, N) pasó de `presupuesto` segundos y se terminó sin tiempo."""
+        clave = self.clave(algoritmo, n, semilla, generador)
+        if clave is None:
+            return
+        self._agregar({"algoritmo": algoritmo, "huella": clave[1], "generador": generador,
+                       "semilla": semilla, "n": n, "python": clave[5],
+                       "fecha": datetime.datetime.now().isoformat(timespec="seconds"),
+                       "descartado": presupuesto})
+
+    def descartado(self, algoritmo, n, semilla, presupuesto, generador="aleatoria"):
+        """True si el mismo código ya agotó un presupuesto de al menos `presupuesto` seg con esa entrada."""
+        limite = self.descartes.get(self.clave(algoritmo, n, semilla, generador))
+        return limite is not None and limite >= presupuesto
+
+    def invalidar(self, algoritmos=None):
+        """Descarta las mediciones vigentes de `algoritmos` (todas si es None); el historial se conserva."""
+        self._agregar({"invalidar": "*" if algoritmos is None else list(algoritmos),
+                       "fecha": datetime.datetime.now().isoformat(timespec="seconds")})
+
+    def exportar_historial(self, ruta):
+        """Vuelca todas las mediciones (vigentes o no) a CSV, para graficar tendencias."""
+        with open(ruta, "w", newline="", encoding="utf-8") as f:
+            w = csv.writer(f)
+            w.writerow(["fecha", "algoritmo", "huella", "generador", "semilla", "n", "python", "tiempo",
+                        "pico_bytes"] + OPERACIONES)
+            for r in self.registros:
+                c = r["conteo"] or {}
+                w.writerow([r["fecha"], r["algoritmo"], r["huella"], r["generador"], r["semilla"], r["n"],
+                            r["python"], r["tiempo"], r["memoria"]] + [c.get(op) for op in OPERACIONES])
+
+
+# Conteo de operaciones
+
+class Contador:
+    """Acumula las operaciones de un ordenamiento que recibe `contador`.
+
+    - comparaciones: comparaciones entre elementos.
+    - intercambios: swaps de dos posiciones.
+    - escrituras: elementos escritos en una lista (copias, appends, swaps...).
+    - asignaciones: listas nuevas creadas (copy, slicing, comprensiones, +).
+
+    Cualquier objeto con estos cuatro atributos enteros sirve como contador.
+    """
+
+    def __init__(self):
+        self.comparaciones = 0
+        self.intercambios = 0
+        self.escrituras = 0
+        self.asignaciones = 0
+
+    def como_dict(self):
+        return {"comparaciones": self.comparaciones, "intercambios": self.intercambios,
+                "escrituras": self.escrituras, "asignaciones": self.asignaciones}
+
+
+class _Contado:
+    """Elemento envuelto que suma en `contador` cada comparación con otro."""
+
+    __slots__ = ("valor", "contador")
+
+    def __init__(self, valor, contador):
+        self.valor = valor
+        self.contador = contador
+
+    def __lt__(self, otro):
+        self.contador.comparaciones += 1
+        return self.valor < otro.valor
+
+    def __le__(self, otro):
+        self.contador.comparaciones += 1
+        return self.valor <= otro.valor
+
+    def __gt__(self, otro):
+        self.contador.comparaciones += 1
+        return self.valor > otro.valor
+
+    def __ge__(self, otro):
+        self.contador.comparaciones += 1
+        return self.valor >= otro.valor
+
+
+ALGORITMOS_CONTADOS = {
+    "Bubble": bubble_sort,
+    "Merge": merge_sort,
+    "Quick": quick_sort,
+}
+OPERACIONES = ["comparaciones", "intercambios", "escrituras", "asignaciones"]
+
+
+def ContarOperaciones(lista, algoritmo, contador=None):
+    """Ordena con la función real pasándole un contador y devuelve las operaciones como dict.
+
+    Los elementos se envuelven en _Contado para contar las comparaciones;
+    copias, escrituras e intercambios los suma la propia función. Los
+    conteos son deterministas para una misma lista, así que permiten
+    comparar el costo algorítmico entre máquinas. Devuelve None si el
+    algoritmo no acepta contador.
+    """
+    if algoritmo not in ALGORITMOS_CONTADOS:
+        return None
+    contador = contador or Contador()
+    ALGORITMOS_CONTADOS[algoritmo]([_Contado(x, contador) for x in lista], contador)
+    return contador.como_dict()
+
+
 # Graficador
 
-def Graficador():
-    tamaños = list(range(50,1050,50)) # [50, 100, 200, 400, 600, 800, 1000]
-    algoritmos = ["Bubble", "Merge", "Quick"]
+# Algoritmos y tamaños del barrido "lineales": hasta 10^7 elementos
+TAMAÑOS_LINEALES = [10**3, 10**4, 10**5, 10**6, 10**7]
+ALGORITMOS_LINEALES = ["Intro", "MergeBU", "NumPy", "Counting", "Radix", "CountingNP", "RadixNP"]
+
+
+def _medir_en_proceso(lista, algoritmo, medir_memoria, contar, conexion):
+    """Trabajador del barrido paralelo: mide una combinación (N, algoritmo) y envía el resultado.
+
+    El tiempo se envía en cuanto se mide, para que el presupuesto solo
+    cubra esa fase; memoria y conteos llegan después en un segundo mensaje.
+    """
+    try:
+        tiempo, _ = Ordenador(lista, algoritmo)
+        conexion.send(("tiempo", tiempo))
+        conteo = ContarOperaciones(lista, algoritmo) if contar else None
+        memoria = MedirMemoria(lista, algoritmo) if medir_memoria else None
+        conexion.send(("extra", memoria, conteo))
+    except Exception as e:  # p. ej. RecursionError de quick_sort
+        conexion.send(("error", type(e).__name__))
+    finally:
+        conexion.close()
+
+
+def _barrido_paralelo(tamaños, algoritmos, procesos, presupuesto, medir_memoria, contar,
+                      generar=Generador, previos=None, descartados=None):
+    """Ejecuta cada (N, algoritmo) en su propio proceso, con hasta `procesos` a la vez.
+
+    Si la ejecución cronometrada pasa de `presupuesto` segundos se termina
+    el proceso y el algoritmo deja de medirse en los tamaños mayores
+    (también se cancelan los que ya estuvieran cronometrándose). Las fases
+    de memoria y conteo, que corren después, no cuentan para el
+    presupuesto. Cada tiempo se imprime en cuanto llega. Las mediciones
+    simultáneas comparten CPU y caché, así que con muchos procesos los
+    tiempos absolutos son algo más ruidosos. Los ALGORITMOS_CON_PROCESOS
+    quedan en NaN: un proceso daemon no puede crear su propio pool. `previos`
+    ({(índice de N, algoritmo): (tiempo, memoria, conteo)}) ya están
+    medidos y no se lanzan. Si se pasa el dict `descartados` se llena con
+    {algoritmo: N en el que agotó el presupuesto}.
+    """
+    previos = previos or {}
+    resultados = {alg: [float("nan")] * len(tamaños) for alg in algoritmos}
+    memoria = {alg: [None] * len(tamaños) for alg in algoritmos}
+    conteos = {alg: [None] * len(tamaños) for alg in algoritmos}
+    for (i, alg), (tiempo, mem, conteo) in previos.items():
+        resultados[alg][i], memoria[alg][i], conteos[alg][i] = tiempo, mem, conteo
+    pendientes = deque((i, alg) for i in range(len(tamaños)) for alg in algoritmos if (i, alg) not in previos)
+    listas = {}
+    descartados = {} if descartados is None else descartados   # algoritmo -> N en el que agotó el presupuesto
+    activos = {}       # conexión -> (proceso, índice de N, algoritmo, inicio); inicio None tras recibir el tiempo
+
+    def cancelar(conexion):
+        proceso = activos.pop(conexion)[0]
+        proceso.terminate()
+        proceso.join()
+        conexion.close()
+
+    def cerrar(conexion):
+        proceso = activos.pop(conexion)[0]
+        proceso.join()
+        conexion.close()
+
+    print("\nN\tAlgoritmo\tTiempo (seg)")
+    for alg in ALGORITMOS_CON_PROCESOS.intersection(algoritmos):
+        print(f"—\t{alg}\t\tlanza sus propios procesos, se omite en el barrido paralelo")
+    while pendientes or activos:
+        while pendientes and len(activos) < procesos:
+            i, alg = pendientes.popleft()
+            if alg in descartados or alg in ALGORITMOS_CON_PROCESOS:
+                continue
+            if i not in listas:
+                listas[i] = generar(tamaños[i])
+            receptor, emisor = mp.Pipe(duplex=False)
+            proceso = mp.Process(target=_medir_en_proceso, args=(listas[i], alg, medir_memoria, contar, emisor), daemon=True)
+            proceso.start()
+            emisor.close()
+            activos[receptor] = (proceso, i, alg, time.perf_counter())
+        if not activos:
+            continue
+
+        espera = None
+        cronometrando = [inicio for _, _, _, inicio in activos.values() if inicio is not None]
+        if presupuesto and cronometrando:
+            espera = max(0.0, min(cronometrando) + presupuesto - time.perf_counter())
+        for conexion in wait(list(activos), espera):
+            proceso, i, alg, inicio = activos[conexion]
+            try:
+                mensaje = conexion.recv()
+            except EOFError:
+                mensaje = ("error", "el proceso terminó sin resultado")
+            if mensaje[0] == "tiempo":
+                resultados[alg][i] = mensaje[1]
+                activos[conexion] = (proceso, i, alg, None)
+                print(f"{tamaños[i]}\t{alg}\t\t{mensaje[1]:.6f}")
+                continue
+            cerrar(conexion)
+            if mensaje[0] == "extra":
+                memoria[alg][i], conteos[alg][i] = mensaje[1], mensaje[2]
+            elif inicio is None:
+                print(f"{tamaños[i]}\t{alg}\t\terror midiendo memoria/conteos: {mensaje[1]}")
+            else:
+                print(f"{tamaños[i]}\t{alg}\t\terror: {mensaje[1]}")
+
+        if presupuesto:
+            ahora = time.perf_counter()
+            for conexion, (_, i, alg, inicio) in list(activos.items()):
+                if conexion in activos and inicio is not None and ahora - inicio > presupuesto:
+                    cancelar(conexion)
+                    descartados[alg] = tamaños[i]
+                    print(f"{tamaños[i]}\t{alg}\t\t> {presupuesto:g} seg, se descarta para N mayores")
+                    # Los N mayores del mismo algoritmo que aún se cronometran tampoco caben
+                    for otra, (_, j, alg2, inicio2) in list(activos.items()):
+                        if alg2 == alg and j > i and inicio2 is not None:
+                            cancelar(otra)
+    return resultados, memoria, conteos
+
+
+# Modelos de crecimiento: en escala log-log, t = c·f(n) es log t = log c + log f(n)
+MODELOS_COMPLEJIDAD = {
+    "O(n)": lambda n: n,
+    "O(n log n)": lambda n: n * np.log2(n),
+    "O(n^2)": lambda n: n ** 2,
+}
+
+# Cuantil 0.975 de la t de Student por grados de libertad (IC del 95 %); para gl > 30 se usa 1.96
+_T_975 = [12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+          2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+          2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042]
+
+
+def ajustar_complejidad(tamaños, tiempos):
+    """Ajusta los tiempos a O(n), O(n log n), O(n^2) y a una ley de potencia t = c·n^k.
+
+    Todas las regresiones se hacen sobre log t, para que cada tamaño pese lo
+    mismo aunque los tiempos cubran varios órdenes de magnitud. Los puntos
+    NaN (descartados) o sin tiempo medible se ignoran. El mejor modelo es el
+    de menor error cuadrático en log t; el exponente k va con su IC del 95 %.
+    Devuelve None si quedan menos de 3 puntos.
+    """
+    n = np.asarray(tamaños, dtype=np.float64)
+    t = np.asarray(tiempos, dtype=np.float64)
+    validos = np.isfinite(t) & (t > 0)
+    n, t = n[validos], t[validos]
+    if len(n) < 3:
+        return None
+    log_n, log_t = np.log(n), np.log(t)
+
+    modelos = {}
+    for nombre, f in MODELOS_COMPLEJIDAD.items():
+        # Con la forma fija solo queda la constante: su MCO es la media del cociente en log
+        log_f = np.log(f(n))
+        log_c = np.mean(log_t - log_f)
+        residuos = log_t - log_f - log_c
+        modelos[nombre] = {"constante": float(np.exp(log_c)), "ecm_log": float(np.mean(residuos ** 2))}
+    mejor = min(modelos, key=lambda m: modelos[m]["ecm_log"])
+
+    # Ley de potencia: regresión lineal log t = log c + k·log n
+    k, log_c = np.polyfit(log_n, log_t, 1)
+    residuos = log_t - (log_c + k * log_n)
+    gl = len(n) - 2
+    sxx = np.sum((log_n - log_n.mean()) ** 2)
+    error_k = math.sqrt(np.sum(residuos ** 2) / gl / sxx) if gl > 0 else float("nan")
+    margen = (_T_975[gl - 1] if gl <= len(_T_975) else 1.96) * error_k
+    return {
+        "puntos": int(len(n)),
+        "mejor": mejor,
+        "modelos": modelos,
+        "exponente": float(k),
+        "ic_inf": float(k - margen),
+        "ic_sup": float(k + margen),
+        "constante_potencia": float(np.exp(log_c)),
+    }
+
+
+def ReporteComplejidad(ajustes):
+    """Imprime el ajuste de cada algoritmo: mejor modelo, exponente con IC y constantes."""
+    print("\n=== AJUSTE DE COMPLEJIDAD ===")
+    print("Algoritmo\tMejor\t\tExponente [IC 95 %]\tc·n^k\t\t" + "\t".join(MODELOS_COMPLEJIDAD))
+    for alg, a in ajustes.items():
+        if a is None:
+            print(f"{alg}\t\tmenos de 3 puntos válidos")
+            continue
+        constantes = "\t".join(f"{a['modelos'][m]['constante']:.3e}" for m in MODELOS_COMPLEJIDAD)
+        print(f"{alg}\t\t{a['mejor']}\t{a['exponente']:.3f} [{a['ic_inf']:.3f}, {a['ic_sup']:.3f}]\t"
+              f"{a['constante_potencia']:.3e}\t{constantes}")
+
+
+def ExportarResultados(ruta, tamaños, resultados, ajustes, conteos=None, memoria=None):
+    """Guarda la tabla de tiempos, los ajustes, los conteos y la memoria en JSON o CSV.
+
+    El formato lo decide la extensión de `ruta`. En CSV la tabla va en
+    `ruta` y lo demás en archivos hermanos terminados en _ajustes.csv,
+    _operaciones.csv y _memoria.csv.
+    """
+    if ruta.endswith(".json"):
+        with open(ruta, "w", encoding="utf-8") as f:
+            json.dump({"tamaños": list(tamaños),
+                       # NaN no es JSON válido: los descartados se guardan como null
+                       "tiempos": {alg: [None if math.isnan(x) else x for x in v] for alg, v in resultados.items()},
+                       "ajustes": ajustes,
+                       "operaciones": conteos or {},
+                       "memoria": memoria or {}}, f, indent=2, ensure_ascii=False)
+        return
+
+    with open(ruta, "w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(["N"] + list(resultados))
+        for i, n in enumerate(tamaños):
+            w.writerow([n] + [resultados[alg][i] for alg in resultados])
+    with open(os.path.splitext(ruta)[0] + "_ajustes.csv", "w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(["algoritmo", "puntos", "mejor", "exponente", "ic_inf", "ic_sup", "constante_potencia"]
+                   + [f"constante {m}" for m in MODELOS_COMPLEJIDAD] + [f"ecm_log {m}" for m in MODELOS_COMPLEJIDAD])
+        for alg, a in ajustes.items():
+            if a is None:
+                continue
+            w.writerow([alg, a["puntos"], a["mejor"], a["exponente"], a["ic_inf"], a["ic_sup"], a["constante_potencia"]]
+                       + [a["modelos"][m]["constante"] for m in MODELOS_COMPLEJIDAD]
+                       + [a["modelos"][m]["ecm_log"] for m in MODELOS_COMPLEJIDAD])
+    if conteos:
+        with open(os.path.splitext(ruta)[0] + "_operaciones.csv", "w", newline="", encoding="utf-8") as f:
+            w = csv.writer(f)
+            w.writerow(["N", "algoritmo"] + OPERACIONES)
+            for alg, por_n in conteos.items():
+                for n, c in zip(tamaños, por_n):
+                    if c:
+                        w.writerow([n, alg] + [c[op] for op in OPERACIONES])
+    if memoria:
+        with open(os.path.splitext(ruta)[0] + "_memoria.csv", "w", newline="", encoding="utf-8") as f:
+            w = csv.writer(f)
+            w.writerow(["N", "algoritmo", "pico_bytes"])
+            for alg, por_n in memoria.items():
+                for n, m in zip(tamaños, por_n):
+                    if m:
+                        w.writerow([n, alg, m])
+
+
+def Graficador(tamaños=None, algoritmos=None, medir_memoria=True, procesos=None, presupuesto=None, exportar=None,
+               contar=False, cache=None, semilla=0):
+    """Barrido (N, algoritmo): tabla y gráfica de tiempos.
+
+    Con `procesos` y/o `presupuesto` (segundos por medición) el barrido se
+    reparte en un pool de procesos y los algoritmos que agotan el
+    presupuesto se descartan para N mayores; sin ellos se ejecuta en serie.
+    Tras la tabla se imprime el ajuste de complejidad de cada algoritmo y,
+    con `exportar`, ambos se guardan en esa ruta (.json o .csv).
+    Con `contar` se añaden los conteos de operaciones de los algoritmos
+    instrumentados (ALGORITMOS_CONTADOS) a la tabla y a la gráfica. Con
+    `medir_memoria` se añade el pico de memoria de cada ejecución como
+    tabla y como panel propio.
+    Con `cache` (un CacheResultados) las listas salen de
+    GenerarEntrada(N, "aleatoria", semilla), se reutilizan las mediciones
+    ya guardadas para el mismo código y entrada, y solo se miden las nuevas.
+    Con `presupuesto` también se recuerdan los descartes: un algoritmo que
+    ya agotó ese presupuesto en un N no se relanza desde ese N.
+    """
+    if tamaños is None:
+        tamaños = list(range(50,1050,50)) # [50, 100, 200, 400, 600, 800, 1000]
+    if algoritmos is None:
+        algoritmos = ["Bubble", "Merge", "Quick", "Intro", "MergeBU", "Natural", "Quick3",
+                      "Counting", "Radix", "CountingNP", "RadixNP"]
+
+    generar = Generador
+    previos = {}
+    if cache is not None:
+        generar = lambda n: GenerarEntrada(n, "aleatoria", semilla, directorio=None)
+        for i, n in enumerate(tamaños):
+            for alg in algoritmos:
+                r = cache.obtener(alg, n, semilla, memoria=medir_memoria, conteo=contar)
+                if r is not None:
+                    previos[(i, alg)] = (r["tiempo"], r["memoria"] if medir_memoria else None,
+                                         r["conteo"] if contar else None)
+        print(f"Caché: {len(previos)} de {len(tamaños) * len(algoritmos)} mediciones reutilizadas")
+        if presupuesto:
+            for alg in algoritmos:
+                i = next((i for i, n in enumerate(tamaños) if cache.descartado(alg, n, semilla, presupuesto)), None)
+                if i is None:
+                    continue
+                print(f"Caché: {alg} ya agotó {presupuesto:g} seg en N={tamaños[i]}, no se mide desde ese N")
+                for j in range(i, len(tamaños)):
+                    previos.setdefault((j, alg), (float("nan"), None, None))
+
+    descartados = {}
+    if procesos or presupuesto:
+        resultados, memoria, conteos = _barrido_paralelo(tamaños, algoritmos, procesos or os.cpu_count() or 1,
+                                                         presupuesto, medir_memoria, contar, generar, previos,
+                                                         descartados)
+    else:
+        resultados = {alg: [] for alg in algoritmos}
+        memoria = {alg: [] for alg in algoritmos}
+        conteos = {alg: [] for alg in algoritmos}
+
+        for i, n in enumerate(tamaños):
+            lista = None
+            print(f"\n🔹 Tamaño de lista: {n}")
+            for alg in algoritmos:
+                if (i, alg) in previos:
+                    tiempo, mem, conteo = previos[(i, alg)]
+                    resultados[alg].append(tiempo)
+                    memoria[alg].append(mem)
+                    conteos[alg].append(conteo)
+                    print(f"{alg}: {tiempo:.6f} seg (caché)")
+                    continue
+                if lista is None:
+                    lista = generar(n)
+                tiempo, _ = Ordenador(lista, alg)
+                resultados[alg].append(tiempo)
+                conteo = ContarOperaciones(lista, alg) if contar else None
+                conteos[alg].append(conteo)
+                if medir_memoria:
+                    pico = MedirMemoria(lista, alg)
+                    memoria[alg].append(pico)
+                    print(f"{alg}: {tiempo:.6f} seg, pico de memoria {pico / 1024:.1f} KiB")
+                else:
+                    memoria[alg].append(None)
+                    print(f"{alg}: {tiempo:.6f} seg")
+
+    if cache is not None:
+        for i, n in enumerate(tamaños):
+            for alg in algoritmos:
+                if (i, alg) not in previos and not math.isnan(resultados[alg][i]):
+                    cache.guardar(alg, n, semilla, resultados[alg][i], memoria[alg][i], conteos[alg][i])
+        for alg, n in descartados.items():
+            cache.descartar(alg, n, semilla, presupuesto)
+
+    # Tabla de resultados
+    print("\n=== TABLA COMPARATIVA ===")
+    print("N\t" + "\t\t".join(algoritmos))
+    for i, n in enumerate(tamaños):
+        print(f"{n}\t" + "\t".join(f"{resultados[alg][i]:.6f}" for alg in algoritmos))
+
+    medidos = [alg for alg in algoritmos if any(memoria[alg])]
+    if medidos:
+        print("\n=== MEMORIA (ejecución aparte) ===")
+        print("N\tAlgoritmo\tPico (KiB)")
+        for i, n in enumerate(tamaños):
+            for alg in medidos:
+                if memoria[alg][i]:
+                    print(f"{n}\t{alg}\t\t{memoria[alg][i] / 1024:.1f}")
+
+    contados = [alg for alg in algoritmos if any(conteos[alg])]
+    if contados:
+        print("\n=== OPERACIONES ===")
+        print("N\tAlgoritmo\t" + "\t".join(OPERACIONES))
+        for i, n in enumerate(tamaños):
+            for alg in contados:
+                if conteos[alg][i]:
+                    print(f"{n}\t{alg}\t\t" + "\t".join(str(conteos[alg][i][op]) for op in OPERACIONES))
+
+    ajustes = {alg: ajustar_complejidad(tamaños, resultados[alg]) for alg in algoritmos}
+    ReporteComplejidad(ajustes)
+    if exportar:
+        ExportarResultados(exportar, tamaños, resultados, ajustes,
+                           {alg: conteos[alg] for alg in contados},
+                           {alg: memoria[alg] for alg in medidos})
+
+    # Gráfica (las mediciones descartadas quedan como NaN y no se dibujan)
+    paneles = 1 + bool(medidos) + bool(contados)
+    fig, ejes = plt.subplots(1, paneles, figsize=(8 * paneles if paneles > 1 else 10, 6), squeeze=False)
+    ax = ejes[0][0]
+    for alg in algoritmos:
+        ax.plot(tamaños, resultados[alg], marker="o", label=alg)
+    ax.set_ylabel("Tiempo de ejecución (segundos)")
+    ax.set_title("Comparación de Algoritmos de Ordenamiento")
+
+    if medidos:
+        ax_mem = ejes[0][1]
+        for alg in medidos:
+            valores = [m / 1024 if m else float("nan") for m in memoria[alg]]
+            ax_mem.plot(tamaños, valores, marker="o", label=alg)
+        ax_mem.set_ylabel("Pico de memoria (KiB)")
+        ax_mem.set_title("Memoria por ejecución")
+
+    if contados:
+        # Comparaciones en línea continua y escrituras en discontinua
+        ax_ops = ejes[0][-1]
+        for alg in contados:
+            color = None
+            for op, estilo in (("comparaciones", "-"), ("escrituras", "--")):
+                valores = [c[op] if c else float("nan") for c in conteos[alg]]
+                linea, = ax_ops.plot(tamaños, valores, estilo, marker="o", color=color, label=f"{alg} ({op})")
+                color = linea.get_color()
+        ax_ops.set_ylabel("Operaciones")
+        ax_ops.set_title("Conteo de operaciones")
+
+    for ax in ejes[0]:
+        # Si el barrido abarca varios órdenes de magnitud, escala log-log
+        if max(tamaños) / min(tamaños) >= 100:
+            ax.set_xscale("log")
+            ax.set_yscale("log")
+        ax.set_xlabel("Tamaño de la lista (N)")
+        ax.legend()
+        ax.grid(True)
+    plt.tight_layout()
+    plt.show()
+
+
+
+def GraficadorDuplicados(n=1000, cardinalidades=(1, 2, 5, 10, 50, 100, 500, 1000, 5000, 9951)):
+    """Fija N y varía cuántas claves distintas hay para ver el efecto de los duplicados.
+
+    El quick_sort original manda los iguales al pivote a un solo lado, así
+    que con pocas claves distintas puede agotar la recursión; esos casos se
+    marcan y quedan como huecos en la gráfica.
+    """
+    algoritmos = ["Merge", "Quick", "Intro", "MergeBU", "Quick3"]
     resultados = {alg: [] for alg in algoritmos}
 
-    for n in tamaños:
-        lista = Generador(n)
-        print(f"\n🔹 Tamaño de lista: {n}")
+    for k in cardinalidades:
+        lista = Generador(n, distintos=k)
+        print(f"\n🔹 Claves distintas: {k} (N = {n})")
         for alg in algoritmos:
-            tiempo, _ = Ordenador(lista, alg)
+            try:
+                tiempo, _ = Ordenador(lista, alg)
+                print(f"{alg}: {tiempo:.6f} seg")
+            except RecursionError:
+                tiempo = float("nan")
+                print(f"{alg}: límite de recursión excedido")
             resultados[alg].append(tiempo)
-            print(f"{alg}: {tiempo:.6f} seg")
 
     # Tabla de resultados
-    print("\n=== TABLA COMPARATIVA ===")
-    print("N\tBubble\t\tMerge\t\tQuick")
-    for i, n in enumerate(tamaños):
-        print(f"{n}\t{resultados['Bubble'][i]:.6f}\t{resultados['Merge'][i]:.6f}\t{resultados['Quick'][i]:.6f}")
+    print("\n=== TABLA POR CLAVES DISTINTAS ===")
+    print("K\t" + "\t\t".join(algoritmos))
+    for i, k in enumerate(cardinalidades):
+        print(f"{k}\t" + "\t".join(f"{resultados[alg][i]:.6f}" for alg in algoritmos))
 
     # Gráfica
     plt.figure(figsize=(10, 6))
     for alg in algoritmos:
-        plt.plot(tamaños, resultados[alg], marker="o", label=alg)
+        plt.plot(cardinalidades, resultados[alg], marker="o", label=alg)
 
-    plt.xlabel("Tamaño de la lista (N)")
+    plt.xscale("log")
+    plt.xlabel("Claves distintas (K)")
     plt.ylabel("Tiempo de ejecución (segundos)")
-    plt.title("Comparación de Algoritmos de Ordenamiento")
+    plt.title(f"Efecto de los duplicados (N = {n})")
     plt.legend()
     plt.grid(True)
     plt.show()
 
 
+def GraficadorMatriz(n=1000, algoritmos=None, distribuciones=None, semilla=0, directorio=DIRECTORIO_DATOS):
+    """Ejecuta cada algoritmo contra cada distribución de entrada con N fijo.
+
+    El quick_sort original toma el primer elemento como pivote, así que en
+    entradas ordenadas o invertidas su recursión tiene profundidad N; los
+    casos que agotan la recursión se marcan y quedan en blanco en el mapa.
+    """
+    if algoritmos is None:
+        algoritmos = ALGORITMOS
+    if distribuciones is None:
+        distribuciones = list(DISTRIBUCIONES_ENTRADA)
+    resultados = {alg: [] for alg in algoritmos}
+
+    for dist in distribuciones:
+        lista = GenerarEntrada(n, dist, semilla, directorio)
+        print(f"\n🔹 Entrada: {dist} (N = {n}, semilla {semilla})")
+        for alg in algoritmos:
+            try:
+                tiempo, _ = Ordenador(lista, alg)
+                print(f"{alg}: {tiempo:.6f} seg")
+            except RecursionError:
+                tiempo = float("nan")
+                print(f"{alg}: límite de recursión excedido")
+            resultados[alg].append(tiempo)
+
+    # Tabla de resultados
+    print("\n=== MATRIZ ALGORITMO × ENTRADA ===")
+    print("Algoritmo\t" + "\t".join(distribuciones))
+    for alg in algoritmos:
+        print(f"{alg}\t\t" + "\t".join(f"{t:.6f}" for t in resultados[alg]))
+
+    # Mapa de calor en escala logarítmica
+    matriz = np.array([resultados[alg] for alg in algoritmos])
+    plt.figure(figsize=(12, 6))
+    plt.imshow(np.log10(matriz), cmap="viridis", aspect="auto")
+    plt.colorbar(label="log10(tiempo en segundos)")
+    plt.xticks(range(len(distribuciones)), distribuciones, rotation=30)
+    plt.yticks(range(len(algoritmos)), algoritmos)
+    for i in range(len(algoritmos)):
+        for j in range(len(distribuciones)):
+            if math.isnan(matriz[i, j]):
+                plt.text(j, i, "recursión", ha="center", va="center", color="black", fontsize=8)
+            else:
+                plt.text(j, i, f"{matriz[i, j] * 1000:.2f} ms", ha="center", va="center", color="white", fontsize=8)
+    plt.title(f"Tiempo por algoritmo y tipo de entrada (N = {n})")
+    plt.tight_layout()
+    plt.show()
+
+
+def GraficadorParalelo(n=200000, max_procesos=None):
+    """Aceleración y eficiencia del merge sort paralelo frente al merge_sort secuencial.
+
+    Para cada P = 1..núcleos el pool se crea antes de medir, así el tiempo
+    no incluye el arranque de procesos.
+    """
+    max_procesos = max_procesos or os.cpu_count() or 1
+    lista = Generador(n)
+    base, _ = Ordenador(lista, "Merge")
+    print(f"\n🔹 N = {n}, merge_sort secuencial: {base:.6f} seg")
+
+    procesos = list(range(1, max_procesos + 1))
+    aceleraciones, eficiencias = [], []
+    print("\n=== TABLA DE ESCALAMIENTO ===")
+    print("P\tTiempo\t\tAceleración\tEficiencia")
+    for p in procesos:
+        with mp.Pool(p) as pool:
+            inicio = time.perf_counter()
+            merge_sort_paralelo(lista, procesos=p, pool=pool)
+            tiempo = time.perf_counter() - inicio
+        aceleracion = base / tiempo
+        aceleraciones.append(aceleracion)
+        eficiencias.append(aceleracion / p)
+        print(f"{p}\t{tiempo:.6f}\t{aceleracion:.2f}x\t\t{aceleracion / p * 100:.0f}%")
+
+    # Gráfica
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
+    ax1.plot(procesos, aceleraciones, marker="o", label="Merge paralelo")
+    ax1.plot(procesos, procesos, "--", color="gray", label="Ideal")
+    ax1.set_xlabel("Procesos (P)")
+    ax1.set_ylabel("Aceleración vs merge_sort")
+    ax1.legend()
+    ax1.grid(True)
+    ax2.plot(procesos, [e * 100 for e in eficiencias], marker="o")
+    ax2.set_xlabel("Procesos (P)")
+    ax2.set_ylabel("Eficiencia (%)")
+    ax2.grid(True)
+    fig.suptitle(f"Merge sort paralelo (N = {n})")
+    plt.show()
+
+
+def ReporteExterno(reporte):
+    """Imprime tiempo y E/S por fase de ordenamiento_externo."""
+    print(f"\n=== ORDENAMIENTO EXTERNO: {reporte['elementos']} elementos ===")
+    print("Fase\t\tSegundos\tLeído (MiB)\tEscrito (MiB)\tCorridas")
+    for f in reporte["fases"]:
+        print(f"{f['fase']}\t{f['segundos']:.3f}\t\t{f['bytes_leidos'] / 2**20:.1f}\t\t"
+              f"{f['bytes_escritos'] / 2**20:.1f}\t\t{f['corridas']}")
+    print(f"Total\t\t{reporte['segundos']:.3f}\t\t{reporte['bytes_leidos'] / 2**20:.1f}\t\t"
+          f"{reporte['bytes_escritos'] / 2**20:.1f}")
+
 
 # Ejecución principal
 
 if __name__ == "__main__":
-    Graficador()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Comparación de algoritmos de ordenamiento")
+    parser.add_argument("--modo", choices=["tamaños", "duplicados", "lineales", "paralelo", "externo", "matriz"], default="tamaños",
+                        help="tamaños: barrido en N; duplicados: N fijo y claves distintas variables; "
+                             "lineales: counting/radix contra O(n log n) hasta 10^7; "
+                             "paralelo: escalamiento del merge sort paralelo; "
+                             "externo: ordena un archivo con memoria acotada; "
+                             "matriz: cada algoritmo contra cada tipo de entrada")
+    parser.add_argument("-n", type=int, default=None,
+                        help="N para los modos duplicados y matriz (1000), paralelo (200000) y externo sin --entrada (10^7)")
+    parser.add_argument("--entrada", help="Archivo de enteros a ordenar (modo externo)")
+    parser.add_argument("--salida", help="Archivo ordenado de salida (modo externo)")
+    parser.add_argument("--formato-entrada", choices=["texto", "binario"], default="texto")
+    parser.add_argument("--formato-salida", choices=["texto", "binario"], default="binario")
+    parser.add_argument("--tam-trozo", type=int, default=1_000_000, help="Enteros por corrida en memoria")
+    parser.add_argument("--fan-in", type=int, default=16, help="Corridas mezcladas a la vez")
+    parser.add_argument("--tamaños", type=int, nargs="+", help="Tamaños del barrido (modos tamaños y lineales)")
+    parser.add_argument("--procesos", type=int, help="Procesos para repartir el barrido")
+    parser.add_argument("--presupuesto", type=float,
+                        help="Segundos por medición; el algoritmo que lo excede se descarta para N mayores")
+    parser.add_argument("--contar", action="store_true",
+                        help="Cuenta comparaciones, intercambios, escrituras y listas nuevas de Bubble, Merge y Quick")
+    parser.add_argument("--semilla", type=int, default=0, help="Semilla de las entradas (modo matriz, y barridos con --cache)")
+    parser.add_argument("--datos", default=DIRECTORIO_DATOS,
+                        help="Directorio de caché de las entradas del modo matriz ('' para no usar caché)")
+    parser.add_argument("--cache", nargs="?", const=RUTA_CACHE,
+                        help="Reutiliza las mediciones guardadas en este archivo (por defecto resultados_cache.jsonl)")
+    parser.add_argument("--invalidar", nargs="*", metavar="ALGORITMO",
+                        help="Con --cache: descarta las mediciones guardadas de estos algoritmos (de todos si no se indica ninguno)")
+    parser.add_argument("--historial", help="Con --cache: exporta todas las mediciones guardadas a este CSV y termina")
+    parser.add_argument("--exportar", help="Guarda la tabla y el ajuste de complejidad (.json o .csv)")
+    args = parser.parse_args()
+
+    if (args.invalidar is not None or args.historial) and not args.cache:
+        parser.error("--invalidar y --historial requieren --cache")
+    cache = None
+    if args.cache:
+        cache = CacheResultados(args.cache)
+        if args.invalidar is not None:
+            cache.invalidar(args.invalidar or None)
+        if args.historial:
+            cache.exportar_historial(args.historial)
+            raise SystemExit
+
+    if args.modo == "duplicados":
+        GraficadorDuplicados(args.n or 1000)
+    elif args.modo == "matriz":
+        GraficadorMatriz(args.n or 1000, semilla=args.semilla, directorio=args.datos)
+    elif args.modo == "paralelo":
+        GraficadorParalelo(args.n or 200000)
+    elif args.modo == "externo":
+        entrada, formato_entrada = args.entrada, args.formato_entrada
+        temporal = None
+        if entrada is None:
+            # Sin archivo: se genera uno de ejemplo temporal que se borra al terminar
+            descriptor, temporal = tempfile.mkstemp(prefix="entrada_externo_", suffix=".txt")
+            os.close(descriptor)
+            entrada, formato_entrada = temporal, "texto"
+            GenerarArchivo(entrada, args.n or 10**7)
+        salida = args.salida or "ordenado.bin"
+        try:
+            ReporteExterno(ordenamiento_externo(entrada, salida, args.tam_trozo, args.fan_in,
+                                                formato_entrada=formato_entrada,
+                                                formato_salida=args.formato_salida))
+        finally:
+            if temporal:
+                os.remove(temporal)
+    elif args.modo == "lineales":
+        Graficador(args.tamaños or TAMAÑOS_LINEALES, ALGORITMOS_LINEALES, medir_memoria=False,
+                   procesos=args.procesos, presupuesto=args.presupuesto, exportar=args.exportar,
+                   contar=args.contar, cache=cache, semilla=args.semilla)
+    else:
+        Graficador(args.tamaños, procesos=args.procesos, presupuesto=args.presupuesto, exportar=args.exportar,
+                   contar=args.contar, cache=cache, semilla=args.semilla)
\ No newline at end of file
@@ -0,0 +1,427 @@
+"""Pruebas de los ordenamientos de Complejidad temporal.py.
+
+El nombre del script no es un módulo importable, así que se carga con
+importlib. Se ejecutan con `python -m pytest` desde esta carpeta o la raíz.
+"""
+import csv
+import importlib.util
+import os
+import pathlib
+import random
+import sys
+import time
+
+import numpy as np
+import pytest
+
+os.environ.setdefault("MPLBACKEND", "Agg")
+_RUTA = pathlib.Path(__file__).with_name("Complejidad temporal.py")
+_spec = importlib.util.spec_from_file_location("complejidad_temporal", _RUTA)
+ct = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = ct  # como un import normal: pickle busca las funciones por nombre
+_spec.loader.exec_module(ct)
+
+
+def _casos():
+    """Entradas pequeñas con los bordes típicos: vacía, un elemento, duplicados, ordenadas..."""
+    rng = random.Random(42)
+    return {
+        "vacia": [],
+        "uno": [7],
+        "dos": [9, 3],
+        "aleatoria": [rng.randint(50, 10000) for _ in range(300)],
+        "duplicados": [rng.choice([5, 50, 500]) for _ in range(300)],
+        "ordenada": list(range(200)),
+        "invertida": list(range(200, 0, -1)),
+        "negativos": [rng.randint(-1000, 1000) for _ in range(300)],
+    }
+
+
+CASOS = _casos()
+
+
+def _comprobar_ordenador(algoritmo):
+    """Ordenador devuelve la lista ordenada en todos los CASOS sin modificar la entrada."""
+    for caso, lista in CASOS.items():
+        original = list(lista)
+        tiempo, ordenada = ct.Ordenador(lista, algoritmo)
+        assert tiempo >= 0
+        assert list(ordenada) == sorted(original), caso
+        assert lista == original, caso
+
+
+# ---------------------------
+# Ordenamientos
+# ---------------------------
+def test_ordenador_algoritmo_desconocido():
+    with pytest.raises(ValueError):
+        ct.Ordenador([3, 1], "Shell")
+
+
+@pytest.mark.parametrize("algoritmo", ct.ALGORITMOS)
+def test_ordenador_todos_los_algoritmos(algoritmo):
+    _comprobar_ordenador(algoritmo)
+
+
+@pytest.mark.parametrize("umbral", [0, 1, 16])
+def test_intro_sort(umbral, monkeypatch):
+    _comprobar_ordenador("Intro")
+    lista = [random.Random(1).randint(0, 50) for _ in range(2000)]
+    assert ct.intro_sort(lista, umbral_insercion=umbral) == sorted(lista)
+    # Con profundidad 0 todo el trabajo lo hace heap sort
+    monkeypatch.setattr(ct.math, "log2", lambda n: 0)
+    assert ct.intro_sort(lista, umbral_insercion=umbral) == sorted(lista)
+
+
+def test_merge_sort_bottom_up_natural_aprovecha_corridas():
+    _comprobar_ordenador("MergeBU")
+    _comprobar_ordenador("Natural")
+    tramos = [list(range(i, i + 100)) for i in range(0, 1000, 100)]
+    random.Random(3).shuffle(tramos)
+    lista = [x for tramo in tramos for x in tramo]
+    assert ct.merge_sort_bottom_up(lista) == sorted(lista)
+    assert ct.merge_sort_bottom_up(lista, natural=True) == sorted(lista)
+    assert ct.merge_sort_bottom_up(list(range(50)), natural=True) == list(range(50))
+
+
+def test_quick_sort_3way_pocas_claves_sin_recursion_profunda():
+    _comprobar_ordenador("Quick3")
+    lista = [1, 2] * 5000  # quick_sort clásico recursaría ~N niveles aquí
+    assert ct.quick_sort_3way(lista) == sorted(lista)
+    assert ct.quick_sort_3way([4] * 10000) == [4] * 10000
+
+
+@pytest.mark.parametrize("distintos", [1, 5, 10000])
+def test_generador_distintos(distintos):
+    lista = ct.Generador(2000, distintos=distintos)
+    assert len(lista) == 2000 and all(50 <= x <= 10000 for x in lista)
+    assert len(set(lista)) <= distintos
+
+
+@pytest.mark.parametrize("distintos", [0, -3])
+def test_generador_distintos_invalido(distintos):
+    with pytest.raises(ValueError):
+        ct.Generador(10, distintos=distintos)
+
+
+@pytest.mark.parametrize("algoritmo", ["Counting", "Radix", "CountingNP", "RadixNP"])
+def test_ordenamientos_lineales(algoritmo):
+    _comprobar_ordenador(algoritmo)
+
+
+@pytest.mark.parametrize("bits", [1, 4, 8, 11, 16])
+def test_radix_sort_bits(bits):
+    lista = CASOS["negativos"] + [10**9, -10**9]
+    assert ct.radix_sort(lista, bits=bits) == sorted(lista)
+    assert ct.radix_sort_numpy(lista, bits=bits) == sorted(lista)
+
+
+@pytest.mark.parametrize("bits", [0, 17, 32])
+def test_radix_sort_numpy_rechaza_bits_fuera_de_rango(bits):
+    with pytest.raises(ValueError):
+        ct.radix_sort_numpy([3, 1, 2], bits=bits)
+
+
+@pytest.mark.parametrize("procesos", [1, 2, 3])
+def test_merge_sort_paralelo(procesos):
+    lista = CASOS["aleatoria"] * 10
+    assert ct.merge_sort_paralelo(lista, procesos=procesos) == sorted(lista)
+    assert ct.merge_sort_paralelo([5], procesos=procesos) == [5]
+    if procesos == 1:
+        _comprobar_ordenador("MergePar")
+
+
+def test_merge_sort_paralelo_con_pool_reutilizado():
+    with ct.mp.Pool(2) as pool:
+        for caso in ("aleatoria", "duplicados", "invertida"):
+            lista = CASOS[caso]
+            assert ct.merge_sort_paralelo(lista, procesos=2, pool=pool) == sorted(lista)
+
+
+# ---------------------------
+# Ordenamiento externo
+# ---------------------------
+def _leer(ruta, formato):
+    if formato == "binario":
+        return np.fromfile(ruta, dtype=np.int64).tolist()
+    return [int(x) for x in pathlib.Path(ruta).read_text().split()]
+
+
+@pytest.mark.parametrize("formato_entrada", ["texto", "binario"])
+@pytest.mark.parametrize("formato_salida", ["texto", "binario"])
+def test_ordenamiento_externo(tmp_path, formato_entrada, formato_salida):
+    entrada = tmp_path / "entrada"
+    salida = tmp_path / "salida"
+    ct.GenerarArchivo(entrada, 5000, formato=formato_entrada, tam_bloque=700)
+    datos = _leer(entrada, formato_entrada)
+    assert len(datos) == 5000
+
+    # 5000 / 300 -> 17 corridas; con fan_in=2 hacen falta varias pasadas de mezcla
+    reporte = ct.ordenamiento_externo(entrada, salida, tam_trozo=300, fan_in=2, tam_bloque=64,
+                                      formato_entrada=formato_entrada, formato_salida=formato_salida,
+                                      directorio_temporal=tmp_path)
+    assert _leer(salida, formato_salida) == sorted(datos)
+    assert reporte["elementos"] == 5000
+    assert reporte["fases"][0]["corridas"] == 17
+    assert len(reporte["fases"]) == 1 + 5  # ceil(log2(17)) pasadas
+    assert reporte["fases"][-1]["corridas"] == 1
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["entrada", "salida"]  # sin temporales
+
+
+def test_ordenamiento_externo_rechaza_fan_in_menor_a_2(tmp_path):
+    with pytest.raises(ValueError):
+        ct.ordenamiento_externo(tmp_path / "a", tmp_path / "b", fan_in=1)
+
+
+# ---------------------------
+# Memoria
+# ---------------------------
+@pytest.mark.parametrize("algoritmo", ["Merge", "Quick", "MergeBU", "Counting", "NumPy"])
+def test_medir_memoria_solo_da_el_pico(algoritmo, monkeypatch):
+    llamadas = []
+    monkeypatch.setattr(ct, "ContarOperaciones", lambda *a: llamadas.append(a))
+    pico = ct.MedirMemoria(CASOS["aleatoria"] * 10, algoritmo)
+    assert isinstance(pico, int) and pico > 0 and not llamadas
+
+
+# ---------------------------
+# Conteo de operaciones
+# ---------------------------
+def _inversiones(lista):
+    return sum(a > b for i, a in enumerate(lista) for b in lista[i + 1:])
+
+
+def test_contar_operaciones_bubble():
+    lista = CASOS["aleatoria"][:150]
+    conteo = ct.ContarOperaciones(lista, "Bubble")
+    n = len(lista)
+    assert conteo["comparaciones"] == n * (n - 1) // 2
+    assert conteo["intercambios"] == _inversiones(lista)
+    assert conteo["escrituras"] == n + 2 * conteo["intercambios"]
+    assert conteo["asignaciones"] == 1
+
+
+@pytest.mark.parametrize("algoritmo", ["Bubble", "Merge", "Quick"])
+def test_contar_operaciones_determinista(algoritmo):
+    lista = CASOS["aleatoria"][:200]
+    conteo = ct.ContarOperaciones(lista, algoritmo)
+    assert conteo == ct.ContarOperaciones(lista, algoritmo)
+    assert set(conteo) == set(ct.OPERACIONES)
+    assert conteo["comparaciones"] > 0
+
+
+def test_merge_sort_comparaciones_acotadas():
+    n = 512
+    conteo = ct.ContarOperaciones(CASOS["aleatoria"][:n] + CASOS["negativos"][:n - 300], "Merge")
+    assert conteo["comparaciones"] <= n * 9  # n·log2(n)
+    assert ct.ContarOperaciones([1, 2, 3], "NumPy") is None
+
+
+@pytest.mark.parametrize("algoritmo", list(ct.ALGORITMOS_CONTADOS))
+def test_contar_operaciones_usa_la_funcion_real(algoritmo):
+    lista = CASOS["aleatoria"][:200]
+    contador = ct.Contador()
+    envueltos = [ct._Contado(x, contador) for x in lista]
+    assert [e.valor for e in ct.ALGORITMOS_CONTADOS[algoritmo](envueltos, contador)] == sorted(lista)
+    assert contador.como_dict() == ct.ContarOperaciones(lista, algoritmo)
+    # Sin contador la función no cambia su resultado
+    assert ct.ALGORITMOS_CONTADOS[algoritmo](lista) == sorted(lista)
+
+
+# ---------------------------
+# Entradas estructuradas
+# ---------------------------
+@pytest.mark.parametrize("distribucion", list(ct.DISTRIBUCIONES_ENTRADA))
+def test_generar_entrada(tmp_path, distribucion):
+    lista = ct.GenerarEntrada(500, distribucion, semilla=5, directorio=None)
+    assert len(lista) == 500 and all(50 <= x <= 10000 for x in lista)
+    assert lista == ct.GenerarEntrada(500, distribucion, semilla=5, directorio=None)
+
+    guardada = ct.GenerarEntrada(500, distribucion, semilla=5, directorio=tmp_path)
+    assert guardada == lista
+    assert len(list(tmp_path.glob(f"{distribucion}_N500_s5*.npy"))) == 1
+    assert ct.GenerarEntrada(500, distribucion, semilla=5, directorio=tmp_path) == lista
+    if distribucion == "ordenada":
+        assert lista == sorted(lista)
+    elif distribucion == "invertida":
+        assert lista == sorted(lista, reverse=True)
+
+
+@pytest.mark.parametrize("distribucion", list(ct.DISTRIBUCIONES_ENTRADA))
+@pytest.mark.parametrize("n", [0, 1])
+def test_generar_entrada_tamaños_minimos(distribucion, n):
+    assert len(ct.GenerarEntrada(n, distribucion, directorio=None)) == n
+
+
+def test_generar_entrada_distribucion_desconocida():
+    with pytest.raises(ValueError):
+        ct.GenerarEntrada(10, "gaussiana", directorio=None)
+
+
+def test_generar_entrada_cambia_de_archivo_si_cambia_el_generador(tmp_path, monkeypatch):
+    ct.GenerarEntrada(50, "sierra", directorio=tmp_path)
+    monkeypatch.setattr(ct.inspect, "getsource", lambda f: "def otro(): pass")
+    ct.GenerarEntrada(50, "sierra", directorio=tmp_path)
+    assert len(list(tmp_path.glob("sierra_N50_s0_*.npy"))) == 2
+
+
+# ---------------------------
+# Barrido paralelo
+# ---------------------------
+def test_barrido_paralelo_presupuesto():
+    # Bubble con N=4000 tarda cerca de 1 s: se cancela y no se prueba N mayor
+    descartados = {}
+    resultados, memoria, conteos = ct._barrido_paralelo([4000, 6000], ["Bubble", "Merge"], 1, 0.5,
+                                                        medir_memoria=True, contar=True, descartados=descartados)
+    assert all(np.isnan(resultados["Bubble"]))
+    assert descartados == {"Bubble": 4000}
+    assert all(t > 0 for t in resultados["Merge"])
+    assert all(m > 0 for m in memoria["Merge"])
+    assert all(c["comparaciones"] > 0 for c in conteos["Merge"])
+
+
+def test_barrido_paralelo_respeta_previos():
+    previos = {(0, "Merge"): (1.5, None, None)}
+    resultados, _, _ = ct._barrido_paralelo([100], ["Merge"], procesos=1, presupuesto=None,
+                                            medir_memoria=False, contar=False, previos=previos)
+    assert resultados["Merge"] == [1.5]
+
+
+def test_barrido_presupuesto_solo_cubre_el_tiempo(monkeypatch):
+    # Los procesos heredan el parche (fork): la memoria tarda más que el presupuesto
+    def memoria_lenta(lista, algoritmo):
+        time.sleep(0.5)
+        return 1
+
+    monkeypatch.setattr(ct, "MedirMemoria", memoria_lenta)
+    resultados, memoria, _ = ct._barrido_paralelo([100, 200], ["Merge"], procesos=1, presupuesto=0.2,
+                                                  medir_memoria=True, contar=False)
+    assert all(t > 0 for t in resultados["Merge"])
+    assert memoria["Merge"] == [1, 1]
+
+
+def test_barrido_paralelo_omite_merge_par():
+    resultados, _, _ = ct._barrido_paralelo([100], ["MergePar", "Merge"], procesos=2, presupuesto=None,
+                                            medir_memoria=False, contar=False)
+    assert np.isnan(resultados["MergePar"][0])  # un proceso daemon no puede crear su pool
+    assert resultados["Merge"][0] > 0
+
+
+# ---------------------------
+# Ajuste de complejidad
+# ---------------------------
+@pytest.mark.parametrize("modelo,exponente", [("O(n)", 1), ("O(n log n)", 1.1), ("O(n^2)", 2)])
+def test_ajustar_complejidad_datos_sinteticos(modelo, exponente):
+    tamaños = [10**3, 3 * 10**3, 10**4, 3 * 10**4, 10**5]
+    f = ct.MODELOS_COMPLEJIDAD[modelo]
+    rng = np.random.default_rng(0)
+    tiempos = [2e-8 * f(n) * rng.uniform(0.97, 1.03) for n in tamaños]
+    ajuste = ct.ajustar_complejidad(tamaños, tiempos)
+    assert ajuste["mejor"] == modelo
+    assert ajuste["puntos"] == 5
+    assert abs(ajuste["exponente"] - exponente) < 0.1
+    assert ajuste["ic_inf"] <= ajuste["exponente"] <= ajuste["ic_sup"]
+
+
+def test_ajustar_complejidad_ignora_nan():
+    assert ct.ajustar_complejidad([10, 100, 1000], [1e-6, float("nan"), 1e-2]) is None
+    ajuste = ct.ajustar_complejidad([10, 100, 1000, 10000], [1e-6, 1e-4, 1e-2, float("nan")])
+    assert ajuste["puntos"] == 3 and ajuste["mejor"] == "O(n^2)"
+
+
+# ---------------------------
+# Caché de resultados
+# ---------------------------
+def test_cache_ida_y_vuelta(tmp_path):
+    ruta = tmp_path / "cache.jsonl"
+    cache = ct.CacheResultados(ruta)
+    assert cache.obtener("Merge", 100, 0) is None
+    cache.guardar("Merge", 100, 0, 0.5, memoria=1234, conteo={"comparaciones": 1, "intercambios": 0,
+                                                                    "escrituras": 3, "asignaciones": 5})
+    cache.guardar("Intro", 100, 0, 0.25)
+    cache.guardar("Intro", 100, 0, 0.75)  # la última medición es la vigente
+
+    recargada = ct.CacheResultados(ruta)
+    registro = recargada.obtener("Merge", 100, 0, memoria=True, conteo=True)
+    assert registro["tiempo"] == 0.5 and registro["memoria"] == 1234
+    assert recargada.obtener("Intro", 100, 0)["tiempo"] == 0.75
+    assert recargada.obtener("Intro", 100, 0, memoria=True) is None  # sin memoria guardada
+    assert recargada.obtener("Intro", 100, 1) is None
+    assert recargada.obtener("Intro", 100, 0, generador="ordenada") is None
+
+    recargada.invalidar(["Merge"])
+    assert recargada.obtener("Merge", 100, 0) is None
+    assert ct.CacheResultados(ruta).obtener("Merge", 100, 0) is None
+    assert ct.CacheResultados(ruta).obtener("Intro", 100, 0) is not None
+    recargada.invalidar()
+    assert ct.CacheResultados(ruta).vigentes == {}
+
+    historial = tmp_path / "historial.csv"
+    recargada.exportar_historial(historial)
+    with open(historial, newline="", encoding="utf-8") as f:
+        filas = list(csv.DictReader(f))
+    assert [f["algoritmo"] for f in filas] == ["Merge", "Intro", "Intro"]  # el historial se conserva
+    assert filas[0]["pico_bytes"] == "1234" and filas[0]["asignaciones"] == "5"
+
+
+def test_cache_descartes(tmp_path):
+    ruta = tmp_path / "cache.jsonl"
+    cache = ct.CacheResultados(ruta)
+    cache.descartar("Bubble", 4000, 0, 0.5)
+    recargada = ct.CacheResultados(ruta)
+    assert recargada.descartado("Bubble", 4000, 0, 0.5)
+    assert recargada.descartado("Bubble", 4000, 0, 0.2)
+    assert not recargada.descartado("Bubble", 4000, 0, 2.0)  # con más presupuesto vale la pena reintentar
+    assert not recargada.descartado("Bubble", 4000, 1, 0.5)
+    assert recargada.obtener("Bubble", 4000, 0) is None
+
+    recargada.guardar("Bubble", 4000, 0, 1.2)  # una medición completa reemplaza el descarte
+    assert not ct.CacheResultados(ruta).descartado("Bubble", 4000, 0, 0.5)
+    recargada.descartar("Bubble", 4000, 0, 0.5)
+    recargada.invalidar(["Bubble"])
+    assert not ct.CacheResultados(ruta).descartado("Bubble", 4000, 0, 0.5)
+
+    historial = tmp_path / "historial.csv"
+    recargada.exportar_historial(historial)
+    with open(historial, newline="", encoding="utf-8") as f:
+        assert [f["tiempo"] for f in csv.DictReader(f)] == ["1.2"]  # los descartes no son mediciones
+
+
+def test_graficador_no_relanza_descartados(tmp_path, monkeypatch):
+    cache = ct.CacheResultados(tmp_path / "cache.jsonl")
+    argumentos = dict(tamaños=[4000, 6000], algoritmos=["Bubble"], medir_memoria=False, procesos=1,
+                      presupuesto=0.5, cache=cache)
+    ct.Graficador(**argumentos)
+    assert cache.descartado("Bubble", 4000, 0, 0.5)
+
+    def sin_procesos(*args, **kwargs):
+        raise AssertionError("no debería lanzarse ninguna medición")
+
+    monkeypatch.setattr(ct.mp, "Process", sin_procesos)
+    ct.Graficador(**argumentos)
+    ct.plt.close("all")
+
+
+def test_huella_cambia_con_el_codigo(monkeypatch):
+    antes = ct.huella_algoritmo("Quick3")
+    assert antes == ct.huella_algoritmo("Quick3")
+    monkeypatch.setitem(ct.FUNCIONES_ALGORITMO, "Quick3", [ct.quick_sort_3way])
+    assert ct.huella_algoritmo("Quick3") != antes
+
+
+def test_cache_huella_por_campo(tmp_path, monkeypatch):
+    assert ct.huella_algoritmo("Quick3") != ct.huella_algoritmo("Quick3", "memoria")
+    ruta = tmp_path / "cache.jsonl"
+    cache = ct.CacheResultados(ruta)
+    cache.guardar("Merge", 100, 0, 0.5, memoria=1)
+    cache.guardar("Intro", 100, 0, 0.5)
+    assert cache.obtener("Merge", 100, 0, memoria=True) is not None
+    assert cache.obtener("Intro", 100, 0, conteo=True) is not None  # Intro no tiene conteos
+
+    # Si cambia el código de medición de memoria, esa parte ya no vale
+    original = ct.huella_algoritmo
+    monkeypatch.setattr(ct, "huella_algoritmo",
+                        lambda alg, campo="tiempo": "otra" if campo == "memoria" else original(alg, campo))
+    nueva = ct.CacheResultados(ruta)
+    assert nueva.obtener("Merge", 100, 0) is not None
+    assert nueva.obtener("Merge", 100, 0, memoria=True) is None